@@ -0,0 +1,76 @@
+"""Compare how long the event loop stalls while writing lines to a slow pipe,
+with the blocking `Console.echo` and `AsyncConsole.echo`.
+
+Usage: python benchmarks/bench_async_console.py [lines]
+"""
+import asyncio, os, sys, threading, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plenty.console import Console
+from plenty.async_console import AsyncConsole
+
+
+def slow_drain(fd: int) -> None:
+    # A reader taking 64K every 100 ms, like a log shipper reading in batches.
+    while os.read(fd, 1 << 16):
+        time.sleep(0.1)
+
+
+async def ticker(stop: asyncio.Event, lags: list) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - start - 0.001)
+
+
+async def write_lines(console, count: int) -> None:
+    for idx in range(count):
+        line = f"`{idx}`<green> line {idx} of the log b`done`"
+        if isinstance(console, AsyncConsole):
+            await console.echo(line)
+        else:
+            console.echo(line)
+        # Other work of the loop.
+        await asyncio.sleep(0)
+    if isinstance(console, AsyncConsole):
+        await console.aclose()
+
+
+def bench(name: str, make_console, count: int) -> None:
+    read_fd, write_fd = os.pipe()
+    reader = threading.Thread(target=slow_drain, args=(read_fd,))
+    reader.start()
+
+    async def main():
+        with open(write_fd, "wb") as file:
+            console = make_console(file)
+            stop = asyncio.Event()
+            lags: list = []
+            tick = asyncio.ensure_future(ticker(stop, lags))
+            start = time.perf_counter()
+            await write_lines(console, count)
+            elapsed = time.perf_counter() - start
+            stop.set()
+            await tick
+        return elapsed, lags
+
+    elapsed, lags = asyncio.run(main())
+    reader.join()
+    os.close(read_fd)
+
+    print(
+        f"{name:<16} {elapsed:8.3f} s  max loop lag {max(lags) * 1000:8.1f} ms"
+        f"  {len(lags):>6} ticks"
+    )
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    print(f"{count} lines to a slow pipe")
+    bench("Console", lambda file: Console(file=file), count)
+    bench("AsyncConsole", lambda file: AsyncConsole(file=file), count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Compare the pure Python and NumPy paths of `batch_true_color_to_256`.
+
+Usage: python benchmarks/bench_color.py [count]
+"""
+import os, random, sys, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plenty.color import batch_escape_256, batch_true_color_to_256
+
+
+def bench(name: str, fn) -> float:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<22} {elapsed:8.3f} s")
+    return elapsed
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(0)
+    rgbs = [
+        (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+        for _ in range(count)
+    ]
+    print(f"{count} colors")
+
+    bench("python", lambda: batch_true_color_to_256(rgbs, use_numpy=False))
+    bench("python escapes", lambda: batch_escape_256(rgbs, use_numpy=False))
+    try:
+        import numpy
+    except ImportError:
+        print("numpy is not installed")
+        return
+
+    array = numpy.array(rgbs, dtype=numpy.uint8)
+    bench("numpy (list)", lambda: batch_true_color_to_256(rgbs, use_numpy=True))
+    bench("numpy (array)", lambda: batch_true_color_to_256(array, use_numpy=True))
+    bench("numpy escapes", lambda: batch_escape_256(array, use_numpy=True))
+
+
+if __name__ == "__main__":
+    main()
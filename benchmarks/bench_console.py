@@ -0,0 +1,110 @@
+"""Compare writing lines to a pipe with and without the console buffer, and
+writing a report to a file with `print` and a file console.
+
+Usage: python benchmarks/bench_console.py [lines]
+"""
+import io, os, sys, tempfile, threading, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plenty.console import Console
+
+
+class CountingFileIO(io.FileIO):
+    """A raw file counting its write syscalls."""
+
+    writes = 0
+
+    def write(self, data) -> int:
+        self.writes += 1
+        return super().write(data)
+
+
+def drain(fd: int) -> None:
+    while os.read(fd, 1 << 16):
+        pass
+
+
+def bench(name: str, write_lines, count: int) -> None:
+    read_fd, write_fd = os.pipe()
+    reader = threading.Thread(target=drain, args=(read_fd,))
+    reader.start()
+
+    raw = CountingFileIO(write_fd, "w")
+    stdout = sys.stdout
+    sys.stdout = io.TextIOWrapper(io.BufferedWriter(raw), encoding="utf-8")
+    try:
+        start = time.perf_counter()
+        write_lines(count)
+        sys.stdout.flush()
+        elapsed = time.perf_counter() - start
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+    reader.join()
+    os.close(read_fd)
+
+    print(f"{name:<28} {elapsed:8.3f} s  {raw.writes:>8} writes")
+
+
+def print_flush(count: int) -> None:
+    for idx in range(count):
+        print(f"line {idx}", flush=True)
+
+
+def console_echo(console: Console):
+    def write_lines(count: int) -> None:
+        for idx in range(count):
+            console.echo(f"line {idx}")
+        console.flush()
+
+    return write_lines
+
+
+def console_batch(count: int) -> None:
+    console = Console()
+    with console.batch():
+        for idx in range(count):
+            console.echo(f"line {idx}")
+
+
+def bench_report(count: int) -> None:
+    # Rendered once up front, only the writing is timed.
+    render_str = Console.render_str
+    lines = [
+        render_str(f"`{idx}`<green> user-{idx} 名字 {idx * 3.5:.2f}\n")
+        for idx in range(count)
+    ]
+
+    with tempfile.TemporaryDirectory() as path:
+        report = os.path.join(path, "report.txt")
+
+        start = time.perf_counter()
+        with open(report, "w", encoding="utf-8") as file:
+            for line in lines:
+                print(line, end="", file=file)
+        print(f"{'print(file=text file)':<28} {time.perf_counter() - start:8.3f} s")
+
+        for name, mode in (("text file", "w"), ("binary file", "wb")):
+            start = time.perf_counter()
+            with open(report, mode) as file:
+                console = Console(file=file)
+                console.writelines(lines)
+            name = f"Console(file={name})"
+            print(f"{name:<28} {time.perf_counter() - start:8.3f} s")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{count} lines to a pipe")
+    bench("print(flush=True)", print_flush, count)
+    bench("echo", console_echo(Console()), count)
+    bench("echo, buffer_size=64K", console_echo(Console(buffer_size=1 << 16)), count)
+    bench("echo in batch()", console_batch, count)
+
+    print(f"{count} lines to a report file")
+    bench_report(count)
+
+
+if __name__ == "__main__":
+    main()
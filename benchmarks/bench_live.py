@@ -0,0 +1,55 @@
+"""Compare the bytes written to redraw a status table, rewriting every line
+and with `Live` writing the changed lines only.
+
+Usage: python benchmarks/bench_live.py [frames]
+"""
+import io, os, sys, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plenty.console import Console
+from plenty.live import Live
+from plenty.table import Table
+
+
+def make_table(frame: int) -> Table:
+    table = Table(title="workers", width=60)
+    table.add_column("Worker", style="green")
+    table.add_column("State")
+    table.add_column("Done", style="cyan")
+    for idx in range(20):
+        # One worker makes progress each frame.
+        done = frame // 20 + (idx < frame % 20)
+        state = "`busy`<yellow>" if idx == frame % 20 else "idle"
+        table.add_row(f"worker-{idx}", state, done)
+    return table
+
+
+class FullRedraw(Live):
+    """Rewrites every line of each frame."""
+
+    def _diff(self, lines, redraw=False):
+        return super()._diff(lines, redraw=True)
+
+
+def bench(name: str, live_class, frames: int) -> None:
+    file = io.StringIO()
+    live = live_class(Console(file=file))
+    start = time.perf_counter()
+    for frame in range(frames):
+        live.update(make_table(frame))
+    elapsed = time.perf_counter() - start
+
+    size = len(file.getvalue().encode())
+    print(f"{name:<14} {elapsed:8.3f} s  {size / frames:10.0f} bytes/frame")
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    print(f"{frames} frames of a 20 row table")
+    bench("full redraw", FullRedraw, frames)
+    bench("Live", Live, frames)
+
+
+if __name__ == "__main__":
+    main()
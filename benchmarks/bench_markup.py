@@ -0,0 +1,121 @@
+"""Compare the single pass markup tokenizer with the old two pass pipeline,
+and compiled markup templates with formatting then rendering markup.
+
+Usage: python benchmarks/bench_markup.py [megabytes]
+"""
+import os, random, re, sys, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plenty.console import Console
+from plenty.emoji import Emoji
+from plenty.markup import compile, render_markup
+from plenty.segment import Segment
+from plenty.style import Style, render_style_markup
+
+LINES = [
+    "2026-10-18 12:00:{:02d} INFO request handled in 3.2ms path=/api/v1/items",
+    "2026-10-18 12:00:{:02d} b`WARN`<yellow> slow query took 1.2s :snail:",
+    "2026-10-18 12:00:{:02d} `ERROR`<red> worker crashed :cross_mark: retrying",
+    "2026-10-18 12:00:{:02d} deploy finished :rainbow: `ok`<green,black> build {}",
+]
+
+
+# The style pattern before the single pass tokenizer.
+OLD_STYLE_RE = re.compile(
+    r"(([a-z]+|\((?:[a-z\s],?)+\))?`(`*.*?`*)`(?:<([a-zA-Z_]+|#[0-9a-fA-F]{6})?(?:,([a-zA-Z_]+|#[0-9a-fA-F]{6}))?>)?)",
+    re.M | re.S,
+)
+
+
+def make_text(size: int) -> str:
+    rng = random.Random(0)
+    lines = []
+    total = 0
+    while total < size:
+        line = rng.choice(LINES).format(rng.randrange(60), total)
+        lines.append(line)
+        total += len(line) + 1
+    return "\n".join(lines)
+
+
+def old_render_str(markup: str) -> str:
+    # The previous Console.render_str: emoji pass, then a style pass.
+    markup = Emoji.render_emoji(markup)
+    return OLD_STYLE_RE.sub(lambda match: render_style_markup(*match.groups()), markup)
+
+
+def old_render_markup(markup: str):
+    # The previous render_markup: emoji pass, then a style pass.
+    markup = Emoji.render_emoji(markup)
+    segments = []
+    position = 0
+    for match in OLD_STYLE_RE.finditer(markup):
+        _, fx, text, color, bg_color = match.groups()
+        start, end = match.span()
+        if start > position:
+            segments.append(Segment(markup[position:start], Style.parse("")))
+        if fx or color or bg_color:
+            sgr = [word for word in (fx, color) if word]
+            if bg_color:
+                sgr.extend(("on", bg_color))
+            segments.append(Segment(text, Style.parse(" ".join(sgr))))
+            position = end
+    if position < len(markup):
+        segments.append(Segment(markup[position:], Style.parse("")))
+    return segments
+
+
+def bench(name: str, fn, text: str) -> None:
+    start = time.perf_counter()
+    fn(text)
+    print(f"{name:<24} {time.perf_counter() - start:8.3f} s")
+
+
+def bench_template(count: int) -> None:
+    template = "b`{status}`<green> {method} {path} in `{elapsed:.1f}ms`<yellow>"
+    values = [
+        dict(
+            status=200 + n % 5, method="GET", path=f"/api/v1/items/{n}", elapsed=n / 7
+        )
+        for n in range(count)
+    ]
+
+    start = time.perf_counter()
+    for value in values:
+        Console.render_str(template.format(**value))
+    print(f"{'format + render_str':<24} {time.perf_counter() - start:8.3f} s")
+
+    start = time.perf_counter()
+    for value in values:
+        compile(template).render(**value)
+    print(f"{'compile().render':<24} {time.perf_counter() - start:8.3f} s")
+
+    start = time.perf_counter()
+    for value in values:
+        render_markup(template.format(**value))
+    print(f"{'format + render_markup':<24} {time.perf_counter() - start:8.3f} s")
+
+    start = time.perf_counter()
+    for value in values:
+        compile(template).segments(**value)
+    print(f"{'compile().segments':<24} {time.perf_counter() - start:8.3f} s")
+
+
+def main() -> None:
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+    text = make_text(int(megabytes * 2**20))
+    print(f"{len(text) / 2**20:.1f} MB of log text")
+
+    bench("render_str (two pass)", old_render_str, text)
+    bench("render_str (tokenizer)", Console.render_str, text)
+    bench("render_markup (two pass)", old_render_markup, text)
+    bench("render_markup (tokenizer)", render_markup, text)
+
+    count = 200_000
+    print(f"{count} lines from one template")
+    bench_template(count)
+
+
+if __name__ == "__main__":
+    main()
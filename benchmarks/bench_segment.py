@@ -0,0 +1,65 @@
+"""Measure the memory of a `Segment`, `Segment.split_and_crop_lines` speed and
+measuring the width of markup cells.
+
+Usage: python benchmarks/bench_segment.py [rows]
+"""
+import os, sys, time, tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plenty.segment import Segment
+from plenty.str_utils import cell_len
+from plenty.style import Style, markup_cell_len
+
+
+def memory_per_segment(count: int = 100_000) -> float:
+    texts = [f"cell {i}" for i in range(count)]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    segments = Segment.make(texts)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del segments
+    return (after - before) / count
+
+
+def split_and_crop(rows: int) -> float:
+    style = Style.parse("green")
+    segments = []
+    for i in range(rows):
+        segments.extend(Segment.make((f"{i:>8}", " name 名字 ", f"{i * 3.5:.2f}"), style))
+        segments.append(Segment.line())
+
+    start = time.perf_counter()
+    for _ in Segment.split_and_crop_lines(segments, 24):
+        pass
+    return time.perf_counter() - start
+
+
+def measure_cells(count: int) -> None:
+    cells = [
+        f"`{i}`<green>" if i % 10 == 0 else f"user-{i} 名字" if i % 10 == 1 else str(i)
+        for i in range(count)
+    ]
+
+    for name, measure in (
+        ("cell_len(clear_text)", lambda cell: cell_len(Style.clear_text(cell))),
+        ("markup_cell_len", markup_cell_len),
+        ("len", len),
+    ):
+        start = time.perf_counter()
+        for cell in cells:
+            measure(cell)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<22} {elapsed:8.3f} s ({count} cells)")
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"memory per segment     {memory_per_segment():8.1f} bytes")
+    print(f"split_and_crop_lines   {split_and_crop(rows):8.3f} s ({rows} rows)")
+    measure_cells(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Compare the cell width engine of `plenty.str_utils` with the old linear scan.
+
+Usage: python benchmarks/bench_str_utils.py
+"""
+import os, sys, timeit
+from functools import lru_cache
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plenty.str_utils import WIDTHS, cell_len, chop_cells, set_cell_size
+
+
+@lru_cache(maxsize=1024)
+def old_get_width(r: int) -> int:
+    if r in {0xE, 0xF}:
+        return 0
+    return next((wid for num, wid in WIDTHS if r <= num), 1)
+
+
+def old_cell_len(cell: str) -> int:
+    return sum(old_get_width(ord(ch)) for ch in cell)
+
+
+CORPORA = {
+    "ascii": "The quick brown fox jumps over the lazy dog. 0123456789 " * 20,
+    "cjk": "床前明月光，疑是地上霜。举头望明月，低头思故乡。" * 20,
+    "mixed": "status: 完成 ✅ user=张三 id=42 🌈 elapsed 3.2s; " * 20,
+    # A wide range of code points, enough to thrash a 1024 entries cache.
+    "cjk-wide": "".join(chr(c) for c in range(0x4E00, 0x4E00 + 4096)),
+}
+
+
+def bench(name: str, fn, number: int) -> float:
+    seconds = min(timeit.repeat(fn, number=number, repeat=3))
+    print(f"  {name:<14} {seconds / number * 1e6:10.2f} us/call")
+    return seconds
+
+
+def main(number: int = 200) -> None:
+    for corpus, text in CORPORA.items():
+        assert old_cell_len(text) == cell_len(text)
+        print(f"{corpus} ({len(text)} chars)")
+        old = bench("old cell_len", lambda: old_cell_len(text), number)
+        new = bench("cell_len", lambda: cell_len(text), number)
+        bench("chop_cells", lambda: chop_cells(text, 40), number)
+        bench("set_cell_size", lambda: set_cell_size(text, 80), number)
+        print(f"  speedup        {old / new:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
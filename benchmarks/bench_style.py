@@ -0,0 +1,58 @@
+"""Measure style combination for a striped table, with and without the cache.
+
+Usage: python benchmarks/bench_style.py [rows]
+"""
+import os, sys, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plenty.console import Console
+from plenty.style import Style
+from plenty.table import Table
+
+
+def striped_table(rows: int) -> Table:
+    table = Table(width=60)
+    table.add_column("Id", style="green")
+    table.add_column("Name", style="yellow")
+    table.add_column("Score")
+    for idx in range(rows):
+        table.add_row(idx, f"user-{idx}", idx * 3.5, style=("on gray", "")[idx % 2])
+    return table
+
+
+def combine(rows: int) -> float:
+    cells = [Style.parse(name) for name in ("green", "yellow", "bold")]
+    stripes = [Style.parse("on gray"), Style.parse("on black")]
+
+    start = time.perf_counter()
+    for idx in range(rows):
+        row_style = stripes[idx % 2]
+        for cell_style in cells:
+            (cell_style + row_style)._make_ansi_code()
+    return time.perf_counter() - start
+
+
+def render(rows: int) -> float:
+    console = Console()
+    table = striped_table(rows)
+
+    start = time.perf_counter()
+    for _ in console.render(table):
+        pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    maxsize = Style.combine_cache.maxsize
+
+    for name, size in (("no cache", 0), ("cache", maxsize)):
+        Style.combine_cache.clear()
+        Style.combine_cache.resize(size)
+        print(f"{name:<9} combine {combine(rows * 10):6.3f} s", end="  ")
+        print(f"render {render(rows):6.3f} s ({rows} rows)")
+
+
+if __name__ == "__main__":
+    main()
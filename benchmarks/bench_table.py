@@ -0,0 +1,59 @@
+"""Compare peak memory of rendering a `Table` from stored and streamed rows.
+
+Usage: python benchmarks/bench_table.py [rows]
+"""
+import os, sys, time, tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plenty.console import Console
+from plenty.table import Table
+
+
+def rows(count: int):
+    for idx in range(count):
+        yield idx, f"user-{idx}", idx * 3.5
+
+
+def make_table() -> Table:
+    table = Table(width=60)
+    table.add_column("Id", style="green")
+    table.add_column("Name")
+    table.add_column("Score", style="cyan")
+    return table
+
+
+def stored(count: int) -> Table:
+    table = make_table()
+    for row in rows(count):
+        table.add_row(*row)
+    return table
+
+
+def streamed(count: int) -> Table:
+    table = make_table()
+    table.add_rows(rows(count))
+    return table
+
+
+def bench(name: str, make, count: int) -> None:
+    console = Console()
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in console.render(make(count)):
+        pass
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{name:<10} {elapsed:8.2f} s  peak {peak / 2**20:8.2f} MiB")
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    print(f"{count} rows")
+    bench("add_row", stored, count)
+    bench("add_rows", streamed, count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compare rendering a large `Table` in one process and in a process pool.
+
+Usage: python benchmarks/bench_table_parallel.py [rows] [max processes]
+"""
+import os, sys, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plenty.console import Console
+from plenty.table import Table
+
+
+def make_table(count: int) -> Table:
+    table = Table(width=80)
+    table.add_column("Id", style="green", width=8)
+    table.add_column("Name", width=24)
+    table.add_column("Score", style="cyan", width=10)
+    table.add_column("Note", width=30)
+    table.add_rows(
+        (idx, f"`user`<yellow>-{idx} 名字", idx * 3.5, f"b`note` {idx % 97}")
+        for idx in range(count)
+    )
+    return table
+
+
+def bench_serial(console: Console, count: int) -> float:
+    start = time.perf_counter()
+    "".join(console.render(make_table(count))).encode(console.encoding)
+    return time.perf_counter() - start
+
+
+def bench_parallel(console: Console, count: int, processes: int) -> float:
+    start = time.perf_counter()
+    for _ in make_table(count).render_parallel(console, processes=processes):
+        pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    max_processes = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    console = Console()
+
+    print(f"{count} rows, {os.cpu_count()} CPUs")
+    serial = bench_serial(console, count)
+    print(f"{'serial':<14} {serial:8.2f} s")
+
+    processes = 1
+    while processes <= max_processes:
+        elapsed = bench_parallel(console, count, processes)
+        name = f"{processes} processes"
+        print(f"{name:<14} {elapsed:8.2f} s  x{serial / elapsed:.2f}")
+        processes *= 2
+
+
+if __name__ == "__main__":
+    main()
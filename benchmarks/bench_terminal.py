@@ -0,0 +1,25 @@
+"""Compare querying the terminal size per call and the shared cached size.
+
+Usage: python benchmarks/bench_terminal.py [calls]
+"""
+import os, shutil, sys, timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plenty.console import Console
+
+
+def main() -> None:
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    console = Console()
+    for name, func in (
+        ("shutil.get_terminal_size", shutil.get_terminal_size),
+        ("Console().width", lambda: Console().width),
+        ("console.width", lambda: console.width),
+    ):
+        elapsed = timeit.timeit(func, number=number)
+        print(f"{name:<26} {elapsed / number * 1e9:8.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
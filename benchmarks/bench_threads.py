@@ -0,0 +1,53 @@
+"""Compare threads echoing markup to one console, rendering inside the console
+lock, rendering outside it and handing the writes to a writer thread.
+
+Usage: python benchmarks/bench_threads.py [lines per thread]
+"""
+import os, sys, threading, time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from plenty.console import Console
+
+
+class LockedConsole(Console):
+    """Renders inside the lock, like the console used to."""
+
+    def echo(self, *values, sep=" ", end="\n", flush=None) -> None:
+        with self._lock:
+            text = sep.join([self._render_value(value) for value in values])
+            self._write(text + end, flush)
+
+
+def bench(name: str, console: Console, threads: int, count: int) -> float:
+    def work(worker: int) -> None:
+        for idx in range(count):
+            console.echo(f"`{worker}`<green> line {idx} :smile: b`done`")
+
+    workers = [threading.Thread(target=work, args=(n,)) for n in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    console.flush()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    print(f"{count} lines per thread to {os.devnull}")
+    with open(os.devnull, "w", encoding="utf-8") as file:
+        consoles = (
+            ("render in lock", lambda: LockedConsole(file=file)),
+            ("render outside lock", lambda: Console(file=file)),
+            ("writer thread", lambda: Console(file=file, writer_thread=True)),
+        )
+        for threads in (1, 4, 16):
+            for name, make_console in consoles:
+                elapsed = bench(name, make_console(), threads, count)
+                print(f"{threads:>2} threads  {name:<22} {elapsed:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
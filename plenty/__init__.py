@@ -24,6 +24,17 @@ def get_console():
     return _console
 
 
-def echo(*values, sep: str = " ", end: str = "\n", file=None, flush: bool = True):
-    value_list = [get_console().render_str(str(value)) for value in values]
-    print(*value_list, sep=sep, end=end, file=file, flush=flush)
+def echo(
+    *values, sep: str = " ", end: str = "\n", file=None, flush: Optional[bool] = None
+):
+    console = get_console()
+    if file is not None:
+        value_list = [console.render_str(str(value)) for value in values]
+        print(*value_list, sep=sep, end=end, file=file, flush=flush is not False)
+        return
+
+    # Through the buffer of the shared console.
+    if values:
+        console.echo(*(str(value) for value in values), sep=sep, end=end, flush=flush)
+    else:
+        console.write(end, flush=flush)
@@ -0,0 +1,114 @@
+"""A compiled, memory-mapped index of the emoji table.
+
+The index is a binary file holding the emoji names sorted by their UTF-8
+bytes, looked up with a bisect over the mapped pages, so the processes
+using it share the pages instead of each building a dict.
+
+Layout (little-endian):
+
+    header    magic (8s) | count (I)
+    records   count * (offset (I) | name length (H) | value length (H))
+    data      name bytes followed by value bytes, for each record
+
+Build it with ``python -m plenty._emoji_index [path]``.
+"""
+from typing import Iterator, Mapping, Tuple
+import mmap, os, struct, sys
+
+INDEX_PATH = os.path.join(os.path.dirname(__file__), "_emoji_codes.idx")
+
+_MAGIC = b"PLNTEMJ1"
+_HEADER = struct.Struct("<8sI")
+_RECORD = struct.Struct("<IHH")
+
+
+def build_index(emoji: Mapping[str, str], path: str = INDEX_PATH) -> None:
+    """Write the index of an emoji table to path."""
+
+    items = sorted(
+        (name.encode("utf-8"), value.encode("utf-8")) for name, value in emoji.items()
+    )
+
+    records = []
+    data = []
+    offset = _HEADER.size + _RECORD.size * len(items)
+    for name, value in items:
+        records.append(_RECORD.pack(offset, len(name), len(value)))
+        data.append(name + value)
+        offset += len(name) + len(value)
+
+    # Write to a temporary file first, readers never see a partial index.
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as file:
+        file.write(_HEADER.pack(_MAGIC, len(items)))
+        file.writelines(records)
+        file.writelines(data)
+    os.replace(tmp_path, path)
+
+
+class EmojiIndex(Mapping[str, str]):
+    """Read-only mapping of emoji names to emoji backed by an index file.
+
+    Args:
+        path (str, optional): The index file. Defaults to `INDEX_PATH`.
+
+    Raises:
+        ValueError: the file is not an emoji index.
+    """
+
+    def __init__(self, path: str = INDEX_PATH) -> None:
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, self._count = _HEADER.unpack_from(self._mmap, 0)
+        except struct.error:
+            magic = b""
+        if magic != _MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path!r} is not an emoji index.")
+
+    def __repr__(self) -> str:
+        return f"<EmojiIndex count={self._count} >"
+
+    def _record(self, index: int) -> Tuple[int, int, int]:
+        return _RECORD.unpack_from(self._mmap, _HEADER.size + _RECORD.size * index)
+
+    def __getitem__(self, name: str) -> str:
+        key = name.encode("utf-8")
+        data = self._mmap
+        record = self._record
+
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset, name_len, value_len = record(mid)
+            mid_key = data[offset : offset + name_len]
+            if mid_key < key:
+                lo = mid + 1
+            elif mid_key > key:
+                hi = mid
+            else:
+                offset += name_len
+                return data[offset : offset + value_len].decode("utf-8")
+        raise KeyError(name)
+
+    def __iter__(self) -> Iterator[str]:
+        data = self._mmap
+        for index in range(self._count):
+            offset, name_len, _ = self._record(index)
+            yield data[offset : offset + name_len].decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        self._mmap.close()
+
+
+if __name__ == "__main__":
+    from plenty._emoji_codes import EMOJI
+
+    index_path = sys.argv[1] if len(sys.argv) > 1 else INDEX_PATH
+    build_index(EMOJI, index_path)
+    print(f"Wrote {len(EMOJI)} emoji to {index_path}")
@@ -0,0 +1,89 @@
+from typing import Generic, Hashable, NamedTuple, Optional, TypeVar
+from collections import OrderedDict
+from threading import Lock
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[K, V]):
+    """A thread-safe cache which drops the least recently used item when full.
+
+    Args:
+        maxsize (int, optional): The max number of items. Defaults to 128.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+        self._cache: "OrderedDict[K, V]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._cache
+
+    def __repr__(self) -> str:
+        return f"<LRUCache {self.info()} >"
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """Get the value of key and mark it as recently used."""
+
+        with self._lock:
+            try:
+                value = self._cache[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: K, value: V) -> V:
+        """Cache the value of key and return the cached value.
+
+        If another thread has cached the key in the meantime, the value
+        already in the cache wins, so every caller shares one instance.
+        """
+
+        with self._lock:
+            cache = self._cache
+            if key in cache:
+                cache.move_to_end(key)
+                return cache[key]
+
+            cache[key] = value
+            while len(cache) > self.maxsize:
+                cache.popitem(last=False)
+            return value
+
+    def resize(self, maxsize: int) -> None:
+        """Change the max number of items, dropping the oldest if needed."""
+
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._cache) > maxsize:
+                self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all items and reset the statistics."""
+
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return the hit/miss statistics, like `functools.lru_cache`."""
+
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._cache))
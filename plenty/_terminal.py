@@ -0,0 +1,90 @@
+"""A process-wide cache of the terminal size.
+
+The size is queried once and kept until the terminal is resized. A
+`SIGWINCH` handler drops it on resize, it's installed from the main
+thread on the first query. Where it can't be, like on windows or when
+first queried from another thread, or once the application replaced
+it, the size is queried again at most every `CHECK_INTERVAL` seconds.
+"""
+from typing import Any, Callable, Optional
+from shutil import get_terminal_size as _query_size
+import os, signal, threading, time
+
+# Seconds a size is trusted without a SIGWINCH handler, and between checks
+# that the handler is still installed.
+CHECK_INTERVAL = 0.5
+
+_size: Optional[os.terminal_size] = None
+_checked = 0.0
+# Bumped on each resize, a query racing a resize doesn't cache a stale size.
+_generation = 0
+
+_handler_installed = False
+_previous_handler: Optional[Callable[..., Any]] = None
+
+
+def _on_resize(signum: int, frame: Any) -> None:
+    global _size, _generation
+
+    _size = None
+    _generation += 1
+    if _previous_handler is not None:
+        _previous_handler(signum, frame)
+
+
+def _install_handler() -> None:
+    global _handler_installed, _previous_handler
+
+    sigwinch = getattr(signal, "SIGWINCH", None)
+    if sigwinch is None or threading.current_thread() is not threading.main_thread():
+        return
+
+    try:
+        previous = signal.getsignal(sigwinch)
+        signal.signal(sigwinch, _on_resize)
+    except (ValueError, OSError):
+        # Not the main interpreter.
+        return
+
+    # Chained, so the handler of the application still runs.
+    _previous_handler = previous if callable(previous) else None
+    _handler_installed = True
+
+
+def _handler_active() -> bool:
+    # The application may have set its own handler since, like curses.
+    return _handler_installed and signal.getsignal(signal.SIGWINCH) is _on_resize
+
+
+def get_terminal_size() -> os.terminal_size:
+    """Get the size of the terminal, like `shutil.get_terminal_size`."""
+
+    global _size, _checked
+
+    size = _size
+    if size is not None:
+        now = time.monotonic()
+        if now - _checked < CHECK_INTERVAL:
+            return size
+        # Trusted for another interval while the handler is still ours,
+        # `signal.getsignal` is too slow to call on every query.
+        if _handler_active():
+            _checked = now
+            return size
+
+    # Installed once, a handler replaced by the application is left as is.
+    if not _handler_installed:
+        _install_handler()
+
+    generation = _generation
+    size = _query_size()
+    if generation == _generation:
+        _size, _checked = size, time.monotonic()
+    return size
+
+
+def invalidate() -> None:
+    """Drop the cached size, the next query asks the terminal."""
+
+    global _size
+    _size = None
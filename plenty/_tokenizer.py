@@ -0,0 +1,135 @@
+from typing import Iterator, List, Match, NamedTuple, Optional, Pattern
+import re
+
+from .emoji import _EMOJI_RE, _VARIANTS, Emoji
+from .style import _STYLE_RE, render_style_markup
+
+# Kinds of token.
+TEXT = "text"
+STYLE = "style"
+
+# Style markup (groups 1-5) or emoji code (groups 6-8), scanned in one pass.
+_TOKEN_RE: Pattern[str] = re.compile(
+    f"{_STYLE_RE.pattern}|{_EMOJI_RE.pattern}", re.M | re.S
+)
+
+
+class Token(NamedTuple):
+    """A piece of markup.
+
+    * Values:
+        .kind: TEXT or STYLE.
+        .text: the plain text, or the content of the style markup.
+        .raw: the style markup as written, kept if it can't be rendered.
+        .fx, .color, .bg_color: the parts of the style markup.
+    """
+
+    kind: str
+    text: str
+    raw: str = ""
+    fx: Optional[str] = None
+    color: Optional[str] = None
+    bg_color: Optional[str] = None
+
+
+def _get_pattern(markup: str, emoji: bool) -> Pattern[str]:
+    return _TOKEN_RE if emoji and markup.count(":") > 1 else _STYLE_RE
+
+
+def tokenize(markup: str, emoji: bool = True) -> Iterator[Token]:
+    """Scan style markup and emoji codes of text at once.
+
+    The emoji are rendered into the text of the tokens, so the plain text
+    between two style markups is one token. Gives the same result as
+    rendering the emoji codes of the whole text first and then the style
+    markup, only a colon pair around a backtick, like ":a`b:", may be read
+    differently, as the first match wins.
+
+    Args:
+        markup (str): The text to scan.
+        emoji (bool, optional): Whether to render emoji codes. Defaults to True.
+
+    Yields:
+        Token: The tokens, in the order of the text.
+    """
+
+    # Without a backtick there is no style markup, only emoji codes.
+    if "`" not in markup:
+        if markup:
+            yield Token(TEXT, Emoji.render_emoji(markup) if emoji else markup)
+        return
+
+    render_emoji = Emoji.render_emoji if emoji else str
+    pattern = _get_pattern(markup, emoji)
+    # Only emoji codes need the table, it's loaded on first use.
+    get_emoji = Emoji.EMOTION.get if pattern is _TOKEN_RE else {}.get
+    get_variant = _VARIANTS.get
+
+    # The plain text and emoji since the last style markup.
+    plain: List[str] = []
+    position = 0
+    for match in pattern.finditer(markup):
+        start = match.start()
+        if start > position:
+            plain.append(markup[position:start])
+        position = match.end()
+
+        raw, fx, content, color, bg_color, *emoji_groups = match.groups()
+        if raw is None:
+            emoji_code, emoji_name, variant = emoji_groups
+            emoji_char = get_emoji(emoji_name.lower())
+            if emoji_char is None:
+                plain.append(emoji_code)
+            else:
+                plain.append(emoji_char + get_variant(variant, ""))
+        elif fx or color or bg_color:
+            if plain:
+                yield Token(TEXT, "".join(plain))
+                plain = []
+            yield Token(STYLE, render_emoji(content), raw, fx, color, bg_color)
+        else:
+            plain.append(render_emoji(raw))
+
+    if position < len(markup):
+        plain.append(markup[position:])
+    if plain:
+        yield Token(TEXT, "".join(plain))
+
+
+def render(markup: str, emoji: bool = True) -> str:
+    """Render style markup and emoji codes of text to ANSI in one pass.
+
+    The matches are read like `tokenize` does, but rendered in place by
+    `re.sub`, without making tokens.
+    """
+
+    if "`" not in markup:
+        return Emoji.render_emoji(markup) if emoji else markup
+
+    if not emoji or markup.count(":") < 2:
+        return _STYLE_RE.sub(_render_style, markup)
+
+    render_emoji = Emoji.render_emoji
+    get_emoji = Emoji.EMOTION.get
+    get_variant = _VARIANTS.get
+
+    def do_replace(match: Match[str]) -> str:
+        raw, fx, content, color, bg_color, emoji_code, emoji_name, variant = (
+            match.groups()
+        )
+        if raw is None:
+            emoji_char = get_emoji(emoji_name.lower())
+            if emoji_char is None:
+                return emoji_code
+            return emoji_char + get_variant(variant, "")
+
+        if not (fx or color or bg_color):
+            return render_emoji(raw)
+        rendered = render_style_markup(raw, fx, render_emoji(content), color, bg_color)
+        return render_emoji(raw) if rendered is raw else rendered
+
+    return _TOKEN_RE.sub(do_replace, markup)
+
+
+def _render_style(match: Match[str]) -> str:
+    return render_style_markup(*match.groups())
@@ -0,0 +1,219 @@
+from typing import IO, Any, List, Optional, Union
+import asyncio, io, os, sys, weakref
+
+from .console import Console
+
+
+class _PipeWriter(asyncio.Protocol):
+    """A write pipe with flow control, written like `asyncio.StreamWriter`."""
+
+    def __init__(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._transport: Optional[asyncio.WriteTransport] = None
+        self._paused = False
+        self._drain_waiter: Optional["asyncio.Future[None]"] = None
+        self._closed: "asyncio.Future[None]" = self._loop.create_future()
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = transport  # type: ignore[assignment]
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        if not self._closed.done():
+            self._closed.set_result(None)
+        self._wake_drain(exc or ConnectionResetError("Connection lost"))
+
+    def pause_writing(self) -> None:
+        self._paused = True
+
+    def resume_writing(self) -> None:
+        self._paused = False
+        self._wake_drain()
+
+    def _wake_drain(self, exc: Optional[Exception] = None) -> None:
+        waiter, self._drain_waiter = self._drain_waiter, None
+        if waiter is not None and not waiter.done():
+            if exc is None:
+                waiter.set_result(None)
+            else:
+                waiter.set_exception(exc)
+
+    def write(self, data: bytes) -> None:
+        self._transport.write(data)
+
+    async def drain(self) -> None:
+        if self._transport.is_closing():
+            # Lets `connection_lost` run, it's called soon after an error.
+            await asyncio.sleep(0)
+        if self._closed.done():
+            raise ConnectionResetError("Connection lost")
+        if self._paused:
+            self._drain_waiter = self._loop.create_future()
+            await self._drain_waiter
+
+    def close(self) -> None:
+        self._transport.close()
+
+    async def wait_closed(self) -> None:
+        await self._closed
+
+
+def _set_blocking(fd: int, blocking: bool) -> None:
+    try:
+        os.set_blocking(fd, blocking)
+    except OSError:
+        # Closed by now.
+        pass
+
+
+class AsyncConsole(Console):
+    """A console for asyncio, writing without blocking the event loop.
+
+    `echo` renders the values at once, like `Console.echo`, then writes
+    them through an `asyncio.StreamWriter` and waits for it to drain.
+    While one echo waits, the text of the others piles up and is written
+    at once after it, they only wait too when more than `high_water`
+    characters are pending.
+
+    Without a writer, the file (or stdout) is opened as a non-blocking
+    pipe, which needs a pipe, socket or terminal. Other files are written
+    from a thread of the default executor instead. Note the non-blocking
+    mode is shared with the other users of the same pipe, like `print`,
+    until `aclose` restores it, or the console is dropped, or at exit.
+
+    Args:
+        writer (asyncio.StreamWriter, optional): The stream to write to.
+            Defaults to None, opened from file.
+        high_water (int, optional): Wait for the output when this many
+            characters are pending. Defaults to 65536.
+        file (IO, optional): The text or binary stream to write to.
+            Defaults to None, `sys.stdout` at the time of writing.
+        encoding (str, optional): The encoding of the output to a stream
+            writer or a binary stream. Defaults to "utf-8".
+
+    Example:
+        >>> console = AsyncConsole()
+        >>> await console.echo("b`hello`<green>")
+        >>> await console.aclose()
+    """
+
+    def __init__(
+        self,
+        writer: Optional[asyncio.StreamWriter] = None,
+        high_water: int = 1 << 16,
+        file: Optional[IO] = None,
+        encoding: str = "utf-8",
+    ) -> None:
+        super().__init__(file=file, encoding=encoding)
+        self.high_water = high_water
+
+        self._stream_writer: Optional[Union[asyncio.StreamWriter, _PipeWriter]] = writer
+        self._owns_writer = False
+        # False once the file turned out not to be a pipe.
+        self._use_pipe = writer is None
+        # Restores the blocking mode of the pipe, called once.
+        self._restore_blocking: Optional[weakref.finalize] = None
+
+        self._pending: List[str] = []
+        self._pending_len = 0
+        # Made in the running loop, an older asyncio binds it on creation.
+        self._drain_lock: Optional[asyncio.Lock] = None
+
+    async def echo(  # type: ignore[override]
+        self,
+        *values: Any,
+        sep: str = " ",
+        end: str = "\n",
+    ) -> None:
+        """Render values and write them, like `print`.
+
+        Args:
+            sep (str, optional): The separator of values. Defaults to " ".
+            end (str, optional): Written after the values. Defaults to "\\n".
+        """
+
+        if not values:
+            return
+
+        text = sep.join([self._render_value(value) for value in values]) + end
+        self._pending.append(text)
+        self._pending_len += len(text)
+
+        drain_lock = self._get_drain_lock()
+        if drain_lock.locked() and self._pending_len < self.high_water:
+            # The running drain writes it next.
+            return
+        await self.drain()
+
+    def _get_drain_lock(self) -> asyncio.Lock:
+        if self._drain_lock is None:
+            self._drain_lock = asyncio.Lock()
+        return self._drain_lock
+
+    async def drain(self) -> None:
+        """Write the pending output and wait until the stream took it."""
+
+        async with self._get_drain_lock():
+            while self._pending:
+                text = "".join(self._pending)
+                del self._pending[:]
+                self._pending_len = 0
+                await self._write_pending(text)
+
+    async def _write_pending(self, text: str) -> None:
+        writer = self._stream_writer
+        if writer is None and self._use_pipe:
+            writer = await self._open_pipe()
+
+        if writer is None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._write_out, text)
+        else:
+            writer.write(text.encode(self._encoding))
+            await writer.drain()
+
+    async def _open_pipe(self) -> Optional[_PipeWriter]:
+        self._use_pipe = False
+        # The console of windows can't be written without blocking.
+        if os.name == "nt":
+            return None
+
+        file = sys.stdout if self.file is None else self.file
+        try:
+            fd = file.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            return None
+
+        # Written so far by the file itself goes first.
+        file.flush()
+        blocking = os.get_blocking(fd)
+        pipe = os.fdopen(os.dup(fd), "wb", buffering=0)
+
+        loop = asyncio.get_running_loop()
+        try:
+            _, writer = await loop.connect_write_pipe(_PipeWriter, pipe)
+        except (ValueError, OSError, NotImplementedError):
+            # Not a pipe, socket or terminal.
+            pipe.close()
+            os.set_blocking(fd, blocking)
+            return None
+
+        # A terminal left non-blocking breaks the writes of the shell too.
+        self._restore_blocking = weakref.finalize(self, _set_blocking, fd, blocking)
+        self._stream_writer = writer
+        self._owns_writer = True
+        return writer
+
+    async def aclose(self) -> None:
+        """Write the pending output, and close the pipe opened from the file."""
+
+        await self.drain()
+        writer = self._stream_writer
+        if writer is not None and self._owns_writer:
+            writer.close()
+            await writer.wait_closed()
+            self._stream_writer = None
+            self._owns_writer = False
+            self._use_pipe = True
+            if self._restore_blocking is not None:
+                self._restore_blocking()
+                self._restore_blocking = None
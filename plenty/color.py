@@ -1,8 +1,10 @@
-from typing import Dict, Literal, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence, Tuple, Union
 import re
 
 from plenty.errors import ColorError
 
+from ._lru_cache import LRUCache
+
 
 RGBType = Tuple[int, int, int]
 Colorable = Union[str, Sequence[int]]
@@ -157,6 +159,14 @@ COLOR_CODE: Dict[str, str] = {
 }
 
 
+# Escape sequences of the 256 colors palette, indexed by the color number.
+FG_256_ESCAPES: Tuple[str, ...] = tuple(f"\033[38;5;{i}m" for i in range(256))
+BG_256_ESCAPES: Tuple[str, ...] = tuple(f"\033[48;5;{i}m" for i in range(256))
+
+# Escape sequences of true colors, keyed on (rgb, depth == "fg").
+TRUE_COLOR_ESCAPES: LRUCache[Tuple[RGBType, bool], str] = LRUCache(maxsize=4096)
+
+
 class Color:
     """Holds representations for a 24-bit color value.
 
@@ -181,6 +191,9 @@ class Color:
 
     TRUE_COLOR: bool = False
 
+    # Shared colors made by `get`, keyed with the color mode they were made in.
+    registry: LRUCache[tuple, "Color"] = LRUCache(maxsize=1024)
+
     def __init__(
         self,
         value: Optional[Colorable] = None,
@@ -300,21 +313,50 @@ class Color:
             color (str): ascii color code.
         """
 
-        dint = 38 if depth == "fg" else 48
+        is_fg = depth == "fg"
         rgb = cls.generate_rgb(hex) if hex else (r, g, b)
 
         if not Color.TRUE_COLOR:
-            return "\033[{};5;{}m".format(dint, Color.true_color_to_256(rgb=rgb))
+            escapes = FG_256_ESCAPES if is_fg else BG_256_ESCAPES
+            return escapes[Color.true_color_to_256(rgb=rgb)]
+
+        key = (rgb, is_fg)
+        escape = TRUE_COLOR_ESCAPES.get(key)
+        if escape is None:
+            escape = TRUE_COLOR_ESCAPES.set(
+                key, "\033[{};2;{};{};{}m".format(38 if is_fg else 48, *rgb)
+            )
+        return escape
+
+    @classmethod
+    def get(
+        cls,
+        value: Optional[Colorable] = None,
+        depth: ColorDepthType = "fg",
+        default: bool = False,
+    ) -> "Color":
+        """Get the shared Color of a value, which must not be modified.
+
+        Each color is made once per `Color.TRUE_COLOR` mode, toggling the
+        mode makes new colors with the matching escape.
+        """
 
-        return "\033[{};2;{};{};{}m".format(dint, *rgb)
+        if isinstance(value, list):
+            value = tuple(value)
+
+        key = (value, depth, default, Color.TRUE_COLOR)
+        color = cls.registry.get(key)
+        if color is None:
+            color = cls.registry.set(key, cls(value, depth, default))
+        return color
 
     @classmethod
     def fg(cls, value: Colorable) -> "Color":
-        return cls(value, depth="fg")
+        return cls.get(value, depth="fg")
 
     @classmethod
     def bg(cls, value: Colorable) -> "Color":
-        return cls(value, depth="bg")
+        return cls.get(value, depth="bg")
 
     @classmethod
     def by_name(cls, name: str, depth: ColorDepthType = "fg") -> "Color":
@@ -345,3 +387,79 @@ class Color:
 
         else:
             return False
+
+
+def _import_numpy(required: Optional[bool]) -> Any:
+    """Import NumPy if it's wanted, it's an optional dependency."""
+
+    if required is False:
+        return None
+    try:
+        import numpy
+    except ImportError:
+        if required:
+            raise
+        return None
+    return numpy
+
+
+def batch_true_color_to_256(
+    rgbs: Iterable[Sequence[int]], use_numpy: Optional[bool] = None
+) -> List[int]:
+    """Quantise many RGB values to the 256 colors palette at once.
+
+    Same as calling `Color.true_color_to_256` on each value, but vectorised
+    with NumPy when it is installed.
+
+    Args:
+        rgbs (Iterable[Sequence[int]]): RGB values, or an array of shape (n, 3).
+        use_numpy (Optional[bool], optional): Force (True) or disable (False)
+            NumPy, None uses it if installed. Defaults to None.
+
+    Returns:
+        List[int]: The palette indexes.
+    """
+
+    np = _import_numpy(use_numpy)
+    if np is None:
+        to_256 = Color.true_color_to_256
+        return [to_256(tuple(int(c) for c in rgb)) for rgb in rgbs]
+
+    # NumPy reads a generator as one object, take its values first.
+    if not isinstance(rgbs, (np.ndarray, Sequence)):
+        rgbs = list(rgbs)
+    rgb = np.asarray(rgbs, dtype=np.int64).reshape(-1, 3)
+    grayscale = rgb // 11
+    is_gray = (grayscale[:, 0] == grayscale[:, 1]) & (
+        grayscale[:, 1] == grayscale[:, 2]
+    )
+    # Same as `round(c / 51)`, a channel never falls on a tie.
+    level = (rgb * 2 + 51) // 102
+    index = np.where(
+        is_gray,
+        232 + grayscale[:, 0],
+        level[:, 0] * 36 + level[:, 1] * 6 + level[:, 2] + 16,
+    )
+    return index.tolist()
+
+
+def batch_escape_256(
+    rgbs: Iterable[Sequence[int]],
+    depth: ColorDepthType = "fg",
+    use_numpy: Optional[bool] = None,
+) -> List[str]:
+    """Get the 256 colors escape sequences of many RGB values at once.
+
+    Args:
+        rgbs (Iterable[Sequence[int]]): RGB values, or an array of shape (n, 3).
+        depth (ColorDepthType, optional): color type. Defaults to "fg".
+        use_numpy (Optional[bool], optional): see `batch_true_color_to_256`.
+
+    Returns:
+        List[str]: The escape sequences.
+    """
+
+    escapes = FG_256_ESCAPES if depth == "fg" else BG_256_ESCAPES
+    return [
+        escapes[index] for index in batch_true_color_to_256(rgbs, use_numpy=use_numpy)
+    ]
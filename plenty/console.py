@@ -1,30 +1,91 @@
-from typing import Any, Iterable, List, Optional, Union
-import sys, platform
-from threading import Lock
+from typing import IO, Any, Iterable, Iterator, List, Optional, Union
+import atexit, io, sys, platform
+from codecs import lookup
+from contextlib import contextmanager
+from queue import Empty, Queue
+from threading import Lock, Thread, Timer, current_thread
 from itertools import islice
 from inspect import isclass
-from shutil import get_terminal_size
+from weakref import ReferenceType, WeakSet, ref
 
 from .style import Style, StyleType
 from .markup import render_markup
 from .segment import Segment
+from .text import Text
 from .emoji import Emoji
+from ._tokenizer import render as render_markup_str
+from ._terminal import get_terminal_size
 from .errors import NotRenderableError, StyleSyntaxError, MissingStyle
 
 
+def _is_binary(file: IO) -> bool:
+    """Return True if file takes bytes, like `open(path, "wb")` or BytesIO."""
+
+    if isinstance(file, io.TextIOBase):
+        return False
+    if isinstance(file, (io.RawIOBase, io.BufferedIOBase)):
+        return True
+    return "b" in getattr(file, "mode", "")
+
+
 class Console:
-    _lock = Lock()
+    """Render objects and write them to stdout or a file.
+
+    The output is kept in a buffer, which is written with one `write`
+    call when it is flushed. By default every `echo` flushes, the
+    buffer options trade that latency for fewer writes.
+
+    Args:
+        buffer_size (int, optional): Flush when this many characters are
+            buffered, 0 flushes on every echo. Defaults to 0.
+        flush_interval (float, optional): Flush buffered output at most this
+            many seconds after it was written. Defaults to None, no limit.
+        file (IO, optional): The text or binary stream to write to, like a
+            file, BytesIO or `socket.makefile("wb")`. Defaults to None,
+            `sys.stdout` at the time of writing.
+        encoding (str, optional): The encoding of the output to a binary
+            stream. Defaults to "utf-8".
+        writer_thread (bool, optional): Write from a thread of the console,
+            which takes the flushed output from a queue and writes what has
+            piled up at once, so `echo` never waits for the stream.
+            Defaults to False.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = 0,
+        flush_interval: Optional[float] = None,
+        file: Optional[IO] = None,
+        encoding: str = "utf-8",
+        writer_thread: bool = False,
+    ) -> None:
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.file = file
+
+        # Bytes are written straight to a binary stream, skipping `print`.
+        self._binary = file is not None and _is_binary(file)
+        self._encoding = encoding
+
+        # Guards the buffer of this console only, values render outside it.
+        self._lock = Lock()
+        self._buffer: List[str] = []
+        self._buffer_len = 0
+        self._batch_level = 0
+        self._flush_timer: Optional[Timer] = None
+        self._writer_queue: Optional["Queue[Optional[str]]"] = (
+            Queue() if writer_thread else None
+        )
+        self._writer: Optional[Thread] = None
 
-    def __init__(self) -> None:
-        self._buffer: List[Any] = []
-        self._size = None
+        # Closed at exit, see also `__del__`.
+        _consoles.add(self)
 
     @property
     def size(self):
-        if not self._size:
-            self._size = get_terminal_size()
+        """The terminal size, shared by the consoles and kept until a resize."""
 
-        return self._size
+        return get_terminal_size()
 
     @property
     def width(self):
@@ -45,6 +106,8 @@ class Console:
 
     @property
     def encoding(self):
+        if self._binary:
+            return self._encoding.lower()
         return sys.getdefaultencoding().lower()
 
     def get_style(
@@ -69,9 +132,20 @@ class Console:
         pad: bool = True,
         new_lines: bool = False,
     ) -> List[List[Segment]]:
-        _rendered = render_markup(renderable)
-        if style:
-            _rendered = Segment.apply_style(_rendered, style)
+        _rendered: Iterable[Union[Segment, Text]]
+        if isinstance(renderable, Text):
+            # Split and cropped on its plain string, then rendered.
+            if style:
+                renderable = Text(
+                    renderable.plain,
+                    style=style + renderable.style,
+                    spans=renderable.spans,
+                )
+            _rendered = [renderable]
+        else:
+            _rendered = render_markup(renderable)
+            if style:
+                _rendered = Segment.apply_style(_rendered, style)
         lines = list(
             islice(Segment.split_and_crop_lines(_rendered, max_width), None, None)
         )
@@ -92,12 +166,12 @@ class Console:
             str: the rendered text string.
         """
 
+        if allow_style:
+            return render_markup_str(text, emoji=allow_emoji)
+
         if allow_emoji:
             text = Emoji.render_emoji(text)
 
-        if allow_style:
-            text = Style.render_style(text)
-
         return text
 
     def render_str2(self, text: str, /, *, style: Optional[Style] = None):
@@ -125,14 +199,232 @@ class Console:
             else:
                 yield from self.render(render_output)
 
-    def echo(self, *values, sep: str = " ", end: str = "\n", flush: bool = True):
+    def echo(
+        self,
+        *values: Any,
+        sep: str = " ",
+        end: str = "\n",
+        flush: Optional[bool] = None,
+    ) -> None:
+        """Render values and write them, like `print`.
+
+        Args:
+            sep (str, optional): The separator of values. Defaults to " ".
+            end (str, optional): Written after the values. Defaults to "\\n".
+            flush (bool, optional): Whether to flush, None follows the buffer
+                options of the console. Defaults to None.
+        """
+
+        if not values:
+            return
+
+        text = sep.join([self._render_value(value) for value in values])
+        with self._lock:
+            self._write(text + end, flush)
+
+    def _render_value(self, value: Any) -> str:
+        # Most values are str, skip the generators of `render` for them.
+        if isinstance(value, str):
+            return self.render_str(value)
+        return "".join(self.render(value))
+
+    def write(self, text: str, flush: Optional[bool] = None) -> None:
+        """Write text as is, through the buffer.
+
+        Args:
+            text (str): The rendered text.
+            flush (bool, optional): Whether to flush, None follows the buffer
+                options of the console. Defaults to None.
+        """
+
         with self._lock:
-            for value in values:
-                render_iter = self.render(value)
-                self._buffer.append("".join(render_iter))
+            self._write(text, flush)
+
+    def writelines(self, lines: Iterable[str], flush: Optional[bool] = None) -> None:
+        """Write texts as is through the buffer, like `file.writelines`.
+
+        Args:
+            lines (Iterable[str]): The rendered texts.
+            flush (bool, optional): Whether to flush, None follows the buffer
+                options of the console. Defaults to None.
+        """
 
-            # print(self._buffer, len(self._buffer))
+        with self._lock:
+            write = self._write
+            # Without a buffer size the lines are held, then written at once.
+            hold = None if self.buffer_size else False
+            for line in lines:
+                write(line, hold)
+            write("", flush)
+
+    def write_bytes(self, data: bytes) -> None:
+        """Write output encoded in `encoding`, after the buffered output.
+
+        A text stream takes the bytes through its binary buffer if it has one
+        in the same encoding, otherwise the bytes are decoded.
+        """
 
+        self.flush()
+        with self._lock:
+            file = sys.stdout if self.file is None else self.file
+            if self._binary:
+                file.write(data)
+                file.flush()
+                return
+
+            buffer = getattr(file, "buffer", None)
+            file_encoding = getattr(file, "encoding", None) or self.encoding
+            if buffer is None or lookup(file_encoding) != lookup(self.encoding):
+                file.write(data.decode(self.encoding))
+                file.flush()
+            else:
+                file.flush()
+                buffer.write(data)
+                buffer.flush()
+
+    def _write(self, text: str, flush: Optional[bool]) -> None:
+        self._buffer.append(text)
+        self._buffer_len += len(text)
+
+        if flush is None:
+            flush = not self._batch_level and self._buffer_len >= self.buffer_size
+        if flush:
+            self._flush()
+        elif self.flush_interval is not None and self._flush_timer is None:
+            timer = Timer(self.flush_interval, self.flush)
+            timer.daemon = True
+            timer.start()
+            self._flush_timer = timer
+
+    def flush(self) -> None:
+        """Write the buffered output, and wait for the writer thread if any."""
+
+        with self._lock:
+            self._flush()
+        if self._writer_queue is not None:
+            self._writer_queue.join()
+
+    def close(self) -> None:
+        """Write the buffered output, and stop the writer thread if any.
+
+        The console can still be used, the thread starts again on the next
+        flush. Consoles are closed at exit.
+        """
+
+        self.flush()
+        self._stop_writer()
+
+    def __del__(self) -> None:
+        # A console dropped with buffered output writes it, the set of
+        # consoles closed at exit only holds the living ones.
+        try:
+            self._stop_writer()
             if self._buffer:
-                print(*self._buffer, sep=sep, end=end, flush=flush)
-                del self._buffer[:]
+                # Written here, the console is gone before a new thread runs.
+                self._write_out("".join(self._buffer))
+        except Exception:
+            pass
+
+    def _flush(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        if self._buffer:
+            text = "".join(self._buffer)
+            del self._buffer[:]
+            self._buffer_len = 0
+
+            if self._writer_queue is None:
+                self._write_out(text)
+            else:
+                self._put_writer(text)
+
+    def _write_out(self, text: str) -> None:
+        file = sys.stdout if self.file is None else self.file
+        if self._binary:
+            # Encoded at once, the whole buffer is one write.
+            file.write(text.encode(self._encoding))
+        else:
+            file.write(text)
+        file.flush()
+
+    def _put_writer(self, text: str) -> None:
+        # Started on first use, and again if a failed write ended it.
+        if self._writer is None or not self._writer.is_alive():
+            # A weak reference, the thread doesn't keep the console alive.
+            self._writer = Thread(
+                target=self._run_writer,
+                args=(ref(self), self._writer_queue),
+                name="plenty-console-writer",
+                daemon=True,
+            )
+            self._writer.start()
+        self._writer_queue.put(text)
+
+    def _stop_writer(self) -> None:
+        writer = self._writer
+        if writer is None:
+            return
+
+        self._writer = None
+        if writer.is_alive():
+            self._writer_queue.put(None)
+            # Dropped by the thread itself, it stops after this write.
+            if writer is not current_thread():
+                writer.join()
+
+    @staticmethod
+    def _run_writer(
+        console_ref: "ReferenceType[Console]", writer_queue: "Queue[Optional[str]]"
+    ) -> None:
+        while True:
+            texts = [writer_queue.get()]
+            try:
+                # Everything flushed since the last write goes out at once.
+                while texts[-1] is not None:
+                    texts.append(writer_queue.get_nowait())
+            except Empty:
+                pass
+
+            stop = texts[-1] is None
+            try:
+                console = console_ref()
+                if console is not None:
+                    console._write_out("".join(texts[:-1] if stop else texts))
+                # Not kept while waiting for the next texts.
+                console = None
+            finally:
+                for _ in texts:
+                    writer_queue.task_done()
+            if stop:
+                return
+
+    @contextmanager
+    def batch(self) -> Iterator["Console"]:
+        """Hold the output written in the block, then write it at once.
+
+        Example:
+            >>> with console.batch():
+            ...     for line in lines:
+            ...         console.echo(line)
+        """
+
+        with self._lock:
+            self._batch_level += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_level -= 1
+                if not self._batch_level:
+                    self._flush()
+
+
+_consoles: "WeakSet[Console]" = WeakSet()
+
+
+@atexit.register
+def _flush_consoles() -> None:
+    for console in list(_consoles):
+        console.close()
@@ -1,5 +1,17 @@
-from typing import Dict, Optional, Match, Callable, Pattern
-import re
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Mapping,
+    Match,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+)
+import os, re
+
+from ._lru_cache import LRUCache
 
 # For encoding.
 Icon_Supported_Encoding: list = ["utf-8"]
@@ -15,7 +27,70 @@ _EMOJI_RE: _ReStringPattern = re.compile(
 )  # allow multi lines.
 
 
-class Emoji:
+def _load_emoji() -> Mapping[str, str]:
+    """Load the emoji table, from the compiled index if one was built.
+
+    See `plenty._emoji_index` for the index, its pages are shared by every
+    process using it.
+    """
+
+    from ._emoji_index import INDEX_PATH, EmojiIndex
+
+    if os.path.exists(INDEX_PATH):
+        try:
+            return EmojiIndex(INDEX_PATH)
+        except (OSError, ValueError):
+            pass
+
+    from ._emoji_codes import EMOJI
+
+    return EMOJI
+
+
+_VARIANTS: Dict[str, str] = {"text": "\uFE0E", "emoji": "\uFE0F"}
+
+# Texts up to this length have their rendering cached.
+_CACHED_TEXT_LENGTH = 256
+
+
+class _EmojiMeta(type):
+    """Load the emoji table on first use, it's big and slow to import.
+
+    Until then `Emoji.EMOTION` and its alias `Emoji.EMOJI` are looked up
+    here, and so are the emoji attributes, like `Emoji.rainbow`.
+    """
+
+    def __getattr__(cls, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        if name == "EMOTION":
+            cls.EMOTION = emotion = _load_emoji()
+            return emotion
+        if name == "EMOJI":
+            # The table was a class attribute by this name too.
+            return cls.EMOTION
+
+        try:
+            return cls.EMOTION[name]
+        except KeyError:
+            raise AttributeError(
+                f"type object {cls.__name__!r} has no attribute {name!r}"
+            ) from None
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name == "EMOTION":
+            # Rendered with the old table.
+            cls.render_cache.clear()
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        if name == "EMOTION":
+            cls.render_cache.clear()
+
+
+class Emoji(metaclass=_EmojiMeta):
     """
     _EMOTION: Dict[str, str] = {
         "rainbow": "🌈",
@@ -45,14 +120,14 @@ class Emoji:
         EMOTION = _WIN_EMOTION
     """
 
-    from ._emoji_codes import EMOJI
-
-    EMOTION: Dict[str, str] = EMOJI
+    # Loaded on first use by `_EmojiMeta`.
+    EMOTION: Mapping[str, str]
 
-    # Set emoji to class.
-    __locals = locals()
-    for k, v in EMOTION.items():
-        __locals[k] = v
+    # Rendered short texts, keyed on (class, text, default variant), cleared
+    # when a table is set.
+    render_cache: LRUCache[Tuple[type, str, Optional[str]], str] = LRUCache(
+        maxsize=1024
+    )
 
     # Try to render the emoji from str. If the emoji code is invalid  will
     # keep raw.
@@ -70,20 +145,46 @@ class Emoji:
         default_variant: Optional[str] = None,
         _emoji_sub: _EmojiSubMethod = _EMOJI_RE.sub,
     ) -> str:
-        get_emoji = cls.EMOTION.__getitem__
-        variants = {"text": "\uFE0E", "emoji": "\uFE0F"}
-        get_variant = variants.get
-        default_variant_code = (
-            variants.get(default_variant, "") if default_variant else ""
-        )
-
-        def do_replace(match: Match[str]) -> str:
-            emoji_code, emoji_name, variant = match.groups()
-            try:
-                return get_emoji(emoji_name.lower()) + get_variant(
-                    variant, default_variant_code
-                )
-            except KeyError:
-                return emoji_code
-
-        return _emoji_sub(do_replace, _msg)
+        # An emoji code needs a pair of colons, most text has none.
+        if _msg.count(":") < 2:
+            return _msg
+
+        cacheable = len(_msg) <= _CACHED_TEXT_LENGTH
+        if cacheable:
+            key = (cls, _msg, default_variant)
+            rendered = cls.render_cache.get(key)
+            if rendered is not None:
+                return rendered
+
+        rendered = _emoji_sub(_get_replacer(cls, default_variant), _msg)
+        if cacheable:
+            cls.render_cache.set(key, rendered)
+        return rendered
+
+
+_REPLACERS: Dict[Tuple[type, Optional[str]], _ReSubCallable] = {}
+
+
+def _get_replacer(
+    emoji_cls: Type[Emoji], default_variant: Optional[str]
+) -> _ReSubCallable:
+    """Get the `re.sub` callback of `Emoji.render_emoji`, made once."""
+
+    key = (emoji_cls, default_variant)
+    if key in _REPLACERS:
+        return _REPLACERS[key]
+
+    get_variant = _VARIANTS.get
+    default_variant_code = get_variant(default_variant, "") if default_variant else ""
+
+    def do_replace(match: Match[str]) -> str:
+        emoji_code, emoji_name, variant = match.groups()
+        try:
+            return emoji_cls.EMOTION[emoji_name.lower()] + get_variant(
+                variant, default_variant_code
+            )
+        except KeyError:
+            return emoji_code
+
+    _REPLACERS[key] = do_replace
+    return do_replace
@@ -0,0 +1,209 @@
+from typing import TYPE_CHECKING, Any, List, Optional
+import re
+
+from .effect import TextEffect
+from .str_utils import cell_len, set_cell_size
+
+if TYPE_CHECKING:
+    from .console import Console
+
+_HIDE_CURSOR = "\033[?25l"
+_SHOW_CURSOR = "\033[?25h"
+# Clear from the cursor to the end of the line, or of the screen.
+_CLEAR_LINE = "\033[K"
+_CLEAR_DOWN = "\033[J"
+
+# An SGR code, like "\033[m" or "\033[38;5;196m", kept when splitting by it.
+_SGR_RE = re.compile(r"(\033\[[\d;]*m)")
+
+
+def _cursor_up(count: int) -> str:
+    return f"\033[{count}A" if count else ""
+
+
+def _cursor_down(count: int) -> str:
+    return f"\033[{count}B" if count else ""
+
+
+def _cursor_column(column: int) -> str:
+    # Columns of the escape code count from 1.
+    return f"\033[{column + 1}G"
+
+
+def _crop_line(line: str, width: int) -> str:
+    """Keep the first width cells of a line, with the ANSI codes in them."""
+
+    if "\033" not in line:
+        return line if cell_len(line) <= width else set_cell_size(line, width)
+    if cell_len(_SGR_RE.sub("", line)) <= width:
+        return line
+
+    # Text and ANSI codes take turns, starting with text.
+    pieces = []
+    remaining = width
+    for index, piece in enumerate(_SGR_RE.split(line)):
+        if index % 2:
+            pieces.append(piece)
+            continue
+
+        piece_size = cell_len(piece)
+        if piece_size > remaining:
+            pieces.append(set_cell_size(piece, remaining))
+            break
+        pieces.append(piece)
+        remaining -= piece_size
+    pieces.append(TextEffect.RESET)
+    return "".join(pieces)
+
+
+class Live:
+    """A region at the bottom of the terminal, redrawn by `update`.
+
+    The lines of the last frame are kept, a new frame only writes the
+    lines that changed, moving the cursor over the others. With
+    cell_diff, a changed line without escape codes is written from the
+    first changed cell only, like a counter ticking up. Lines are cropped
+    to the width of the terminal, so each of them takes one row.
+
+    Args:
+        console (Console, optional): The console to write to. Defaults to
+            None, the shared console of `plenty.echo`.
+        cell_diff (bool, optional): Whether to write only the changed part of
+            plain lines. Defaults to False.
+
+    Example:
+        >>> with Live() as live:
+        ...     for status in statuses:
+        ...         live.update(make_table(status))
+    """
+
+    def __init__(
+        self, console: Optional["Console"] = None, cell_diff: bool = False
+    ) -> None:
+        if console is None:
+            from . import get_console
+
+            console = get_console()
+
+        self.console = console
+        self.cell_diff = cell_diff
+
+        self._lines: List[str] = []
+        self._width: Optional[int] = None
+        self._started = False
+
+    def __enter__(self) -> "Live":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Hide the cursor, it would flicker over the redrawn lines."""
+
+        if not self._started:
+            self._started = True
+            self.console.write(_HIDE_CURSOR, flush=True)
+
+    def stop(self) -> None:
+        """Leave the last frame as it is and show the cursor again."""
+
+        if self._started:
+            self._started = False
+            self._lines = []
+            self.console.write(_SHOW_CURSOR, flush=True)
+
+    def update(self, renderable: Any) -> None:
+        """Render a new frame and write the lines changed since the last one."""
+
+        console = self.console
+        text = "".join(console.render(renderable))
+        lines = text.split("\n")
+        if text.endswith("\n"):
+            lines.pop()
+
+        # The cursor can't move above the screen, keep the top lines.
+        max_height = console.size.lines - 1
+        if max_height > 0:
+            del lines[max_height:]
+
+        # Lines wrapped at the old width move around, draw them all again.
+        width = console.width
+        redraw = width != self._width
+        self._width = width
+        # A wrapped line would take more rows than the cursor moves over.
+        lines = [_crop_line(line, width) for line in lines]
+
+        console.write(self._diff(lines, redraw), flush=True)
+        self._lines = lines
+
+    def _diff(self, lines: List[str], redraw: bool = False) -> str:
+        """The output from the last frame to lines.
+
+        The cursor is kept at the start of the line below the frame.
+        """
+
+        previous = self._lines
+        if lines == previous and not redraw:
+            return ""
+
+        output = [_cursor_up(len(previous))]
+        append = output.append
+        cell_diff = self.cell_diff
+
+        # Unchanged lines the cursor moves down over.
+        skip = 0
+        for index, line in enumerate(lines):
+            old_line = previous[index] if index < len(previous) else None
+            if line == old_line and not redraw:
+                skip += 1
+                continue
+            append(_cursor_down(skip))
+            skip = 0
+
+            change = None
+            if cell_diff and old_line is not None and not redraw:
+                change = self._diff_cells(old_line, line)
+            if change is None:
+                # Cleared first, clearing after a full line would take its
+                # last cell.
+                append(_CLEAR_LINE)
+                append(line)
+                # Styles don't leak into the next line.
+                if "\033" in line:
+                    append(TextEffect.RESET)
+            else:
+                append(change)
+            append("\n")
+
+        append(_cursor_down(skip))
+        if len(lines) < len(previous):
+            append(_CLEAR_DOWN)
+        return "".join(output)
+
+    @staticmethod
+    def _diff_cells(old_line: str, line: str) -> Optional[str]:
+        """The output from old_line to line, None if they have escape codes."""
+
+        if "\033" in old_line or "\033" in line:
+            return None
+
+        start = 0
+        end = min(len(old_line), len(line))
+        while start < end and old_line[start] == line[start]:
+            start += 1
+
+        column = cell_len(line[:start])
+        if cell_len(old_line) != cell_len(line):
+            return f"{_cursor_column(column)}{_CLEAR_LINE}{line[start:]}"
+
+        # The same width, the unchanged end of the line stays.
+        end = len(line)
+        old_end = len(old_line)
+        while (
+            end > start and old_end > start and line[end - 1] == old_line[old_end - 1]
+        ):
+            end -= 1
+            old_end -= 1
+        return f"{_cursor_column(column)}{line[start:end]}"
@@ -1,39 +1,26 @@
-from typing import Generator, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+from bisect import insort
+from operator import itemgetter
+from string import Formatter
 import re
 
+from .color import Color
 from .emoji import Emoji
-from .style import _STYLE_RE, Style, StyleType
+from .style import Style, StyleType, render_style_markup
+from ._lru_cache import LRUCache
+from ._tokenizer import STYLE, tokenize
 from .segment import Segment
-from .errors import MarkupError
-
-
-def _parse(markup: str) -> Generator:
-    position = 0
-
-    for match in _STYLE_RE.finditer(markup):
-        full_text, fx, pure_text, color, bg_color = match.groups()
-        start, end = match.span()
-        if start > position:
-            yield markup[position:start], None, None, None
-        if fx or color or bg_color:
-            yield pure_text, fx, color, bg_color
-            position = end
-
-    if position < len(markup):
-        yield markup[position:], None, None, None
+from .errors import MarkupError, StyleSyntaxError
 
 
 def render_markup(
     markup: str, style: Optional[StyleType] = None, emoji: bool = True
 ) -> List[Segment]:
-    if emoji:
-        markup = Emoji.render_emoji(markup)
-
     if isinstance(style, str):
         style = Style.parse(style)
 
     renderables: List[Segment] = []
-    for text, fx, color, bg_color in _parse(markup):
+    for _, text, _, fx, color, bg_color in tokenize(markup, emoji=emoji):
         sgr = []
         if fx:
             sgr.append(fx)
@@ -52,6 +39,152 @@ def render_markup(
     return renderables
 
 
+_RESET = "\033[0m"
+
+
+class MarkupTemplate:
+    """A markup template parsed once, rendered with different values.
+
+    The template is a `str.format` string with style markup, like
+    "b`{status}`<green> {path}". The ANSI of the markup is rendered when
+    compiling, so rendering only formats the values in. The values are
+    plain text, markup or emoji codes in them are kept as is.
+
+    Use `compile` to get a cached template. The ANSI follows the
+    `Color.TRUE_COLOR` mode at compile time.
+
+    Args:
+        template (str): The markup template.
+        style (StyleType, optional): The base style of the segments. Defaults to None.
+        emoji (bool, optional): Whether to render emoji codes. Defaults to True.
+
+    Raises:
+        ValueError: the template is not a valid format string.
+    """
+
+    # Compiled templates, keyed on (template, style, emoji, Color.TRUE_COLOR).
+    cache: LRUCache[
+        Tuple[str, Optional[StyleType], bool, bool], "MarkupTemplate"
+    ] = LRUCache(maxsize=1024)
+
+    def __init__(
+        self, template: str, style: Optional[StyleType] = None, emoji: bool = True
+    ) -> None:
+        self.template = template
+        self.style = Style.parse(style) if isinstance(style, str) else style
+        self.emoji = emoji
+
+        self._tokens = list(tokenize(template, emoji=emoji))
+        self._segment_parts: Optional[List[Tuple[str, Style]]] = None
+
+        pieces = []
+        for kind, text, raw, fx, color, bg_color in self._tokens:
+            if kind != STYLE:
+                pieces.append(text)
+                continue
+
+            rendered = render_style_markup(raw, fx, "", color, bg_color)
+            if rendered is raw:
+                # Kept raw, like `Console.render_str` does.
+                pieces.append(Emoji.render_emoji(raw) if emoji else raw)
+            else:
+                pieces.extend((rendered[: -len(_RESET)], text, _RESET))
+        self._format = "".join(pieces)
+
+        # Parse the format string now, it raises on a bad one.
+        self.fields = tuple(
+            field for _, field, _, _ in Formatter().parse(self._format) if field
+        )
+
+    def __repr__(self) -> str:
+        return f"<MarkupTemplate {self.template!r} >"
+
+    def render(self, *args: Any, **values: Any) -> str:
+        """Render the template with values to a str with ANSI.
+
+        Same as `Console.render_str` of the formatted template, but the
+        values are not read as markup.
+        """
+
+        return self._format.format(*args, **values)
+
+    def segments(self, *args: Any, **values: Any) -> List[Segment]:
+        """Render the template with values to segments, like `render_markup`."""
+
+        return [
+            Segment(text.format(*args, **values), style=style)
+            for text, style in self._get_segment_parts()
+        ]
+
+    def _get_segment_parts(self) -> List[Tuple[str, Style]]:
+        # Styles are parsed on first use, as `render` needs none of them.
+        if self._segment_parts is None:
+            parts = []
+            # Each part is formatted on its own, so auto-numbered fields are
+            # numbered over the whole template first.
+            field_index = 0
+            for _, text, _, fx, color, bg_color in self._tokens:
+                text, field_index = _number_fields(text, field_index)
+                sgr = [fx, color, "on" if bg_color else None, bg_color]
+                sep_style = Style.parse(" ".join(word for word in sgr if word))
+                if self.style:
+                    sep_style = self.style + sep_style
+                parts.append((text, sep_style))
+            self._segment_parts = parts
+        return self._segment_parts
+
+
+def _number_fields(format_string: str, index: int) -> Tuple[str, int]:
+    """Number the auto-numbered fields of a format string, from index on.
+
+    Returns:
+        Tuple[str, int]: the format string, and the index of the next field.
+    """
+
+    pieces = []
+    for literal, field, spec, conversion in Formatter().parse(format_string):
+        pieces.append(literal.replace("{", "{{").replace("}", "}}"))
+        if field is None:
+            continue
+
+        # Like "{}", "{.name}" or "{[0]}".
+        if not field or field[0] in ".[":
+            field = f"{index}{field}"
+            index += 1
+        if conversion:
+            field += f"!{conversion}"
+        if spec:
+            spec, index = _number_fields(spec, index)
+            field += f":{spec}"
+        pieces.append(f"{{{field}}}")
+    return "".join(pieces), index
+
+
+def compile(
+    template: str, style: Optional[StyleType] = None, emoji: bool = True
+) -> MarkupTemplate:
+    """Compile a markup template, see `MarkupTemplate`.
+
+    The template is compiled once and shared from `MarkupTemplate.cache`.
+
+    Args:
+        template (str): The markup template, like "b`{status}`<green>".
+        style (StyleType, optional): The base style of the segments. Defaults to None.
+        emoji (bool, optional): Whether to render emoji codes. Defaults to True.
+
+    Returns:
+        MarkupTemplate: the compiled template.
+    """
+
+    key = (template, style, emoji, Color.TRUE_COLOR)
+    compiled = MarkupTemplate.cache.get(key)
+    if compiled is None:
+        compiled = MarkupTemplate.cache.set(
+            key, MarkupTemplate(template, style=style, emoji=emoji)
+        )
+    return compiled
+
+
 tag_re = re.compile(r"((\\*)\[([a-z#/@][^[]*?)])", re.VERBOSE)
 
 
@@ -85,21 +218,58 @@ def parse(string: str) -> Iterable[Tuple[int, Optional[str], Optional[str]]]:
         yield position, string[position:], None
 
 
-def markup(string: str, style: Optional[str] = None, emoji: bool = True):
+class Span(NamedTuple):
+    """A style over text[start:end] of a parsed markup."""
+
+    start: int
+    end: int
+    style: Style
+
+
+def _tag_style(tag: str) -> Style:
+    try:
+        return Style.parse(tag.strip())
+    except StyleSyntaxError as error:
+        raise MarkupError(f"invalid style of the tag '[{tag}]': {error}") from None
+
 
-    text: List = []
+def parse_markup(string: str, emoji: bool = True) -> Tuple[str, List[Span]]:
+    """Parse bracket tag markup, like "[bold]Hello[/bold]", to text and spans.
+
+    A tag not closed is open to the end of the text.
+
+    Args:
+        string (str): The markup.
+        emoji (bool, optional): Whether to render emoji codes. Defaults to True.
+
+    Raises:
+        MarkupError: a closing tag doesn't match the open tag, or a tag is
+            not a valid style.
+
+    Returns:
+        Tuple[str, List[Span]]: the text and its spans, in the order of the
+            open tags, so an outer span is before the spans inside it.
+    """
+
+    text: List[str] = []
     text_append = text.append
+    length = 0
 
-    style_stack: List = []
+    # The offset in text, order and name of the open tags.
+    style_stack: List[Tuple[int, int, str]] = []
     style_pop = style_stack.pop
 
-    spans: List = []
+    # Spans with the order of their open tag.
+    spans: List[Tuple[int, Span]] = []
     append_span = spans.append
 
-    for position, plain_text, tag in parse(string):
+    for _, plain_text, tag in parse(string):
         if plain_text is not None:
             plain_text = plain_text.replace("\\[", "[")
-            text.append(plain_text)
+            if emoji:
+                plain_text = Emoji.render_emoji(plain_text)
+            text_append(plain_text)
+            length += len(plain_text)
         elif tag is not None:
             if tag.startswith("/"):
                 style_name = tag[1:].strip()
@@ -108,9 +278,8 @@ def markup(string: str, style: Optional[str] = None, emoji: bool = True):
                     # Invalid closing tag
                     raise MarkupError("Invalid tag without any content") from None
 
-                style_name = style_name
                 try:
-                    start, open_tag = style_pop()
+                    start, order, open_tag = style_pop()
                 except IndexError:
                     # No corresponding open tag found
                     raise MarkupError("tag not have open") from None
@@ -121,15 +290,99 @@ def markup(string: str, style: Optional[str] = None, emoji: bool = True):
                         f"the closing tag '{tag}' not same with the open tag '{open_tag}'"
                     ) from None
 
-                append_span((start, len(text), open_tag))
+                # The style is still checked, an empty span is dropped.
+                tag_style = _tag_style(open_tag)
+                if start < length:
+                    append_span((order, Span(start, length, tag_style)))
 
             else:  # Open Tag
-                style_stack.append((len(text), tag))
+                style_stack.append((length, len(style_stack) + len(spans), tag))
 
-    text_length = len(text)
     while style_stack:
-        start, tag = style_pop()
-        if style := str(tag):
-            append_span((start, text_length, style))
+        start, order, tag = style_pop()
+        if tag.strip():
+            tag_style = _tag_style(tag)
+            if start < length:
+                append_span((order, Span(start, length, tag_style)))
+
+    spans.sort(key=itemgetter(0))
+    return "".join(text), [span for _, span in spans]
+
+
+def render_spans(
+    text: str, spans: List[Span], style: Optional[StyleType] = None
+) -> List[Segment]:
+    """Render text with its spans to segments in one sweep.
+
+    The text is cut at each start and end of the spans. The styles over a
+    piece are combined once, in the order of the spans, pieces under the
+    same spans share the combined style.
+
+    Args:
+        text (str): The text.
+        spans (List[Span]): The spans over text, an outer span must be
+            before the spans inside it, like `parse_markup` gives.
+        style (StyleType, optional): The base style. Defaults to None.
+
+    Returns:
+        List[Segment]: the segments, without empty ones.
+    """
+
+    if isinstance(style, str):
+        style = Style.parse(style)
+    base_style = style or Style.null()
+
+    # (offset, is start, index of span), ends sort before starts. An empty
+    # span styles nothing, its end would sort before its own start.
+    spans = [span for span in spans if span.start < span.end]
+    events = sorted(
+        [(span.start, True, index) for index, span in enumerate(spans)]
+        + [(span.end, False, index) for index, span in enumerate(spans)]
+    )
+
+    segments: List[Segment] = []
+    active: List[int] = []
+    combined: Dict[Tuple[int, ...], Style] = {(): base_style}
+    position = 0
+    for offset, is_start, index in events:
+        if offset > position:
+            key = tuple(active)
+            current_style = combined.get(key)
+            if current_style is None:
+                current_style = base_style
+                for active_index in key:
+                    current_style = current_style + spans[active_index].style
+                combined[key] = current_style
+            segments.append(Segment(text[position:offset], style=current_style))
+            position = offset
+
+        if is_start:
+            insort(active, index)
+        else:
+            active.remove(index)
+
+    if position < len(text):
+        segments.append(Segment(text[position:], style=base_style))
+
+    return segments
+
+
+def markup(
+    string: str, style: Optional[StyleType] = None, emoji: bool = True
+) -> List[Segment]:
+    """Render bracket tag markup, like "[bold]Hello[/bold]", to segments.
+
+    Args:
+        string (str): The markup.
+        style (StyleType, optional): The base style. Defaults to None.
+        emoji (bool, optional): Whether to render emoji codes. Defaults to True.
+
+    Raises:
+        MarkupError: the markup is invalid, see `parse_markup`.
+
+    Returns:
+        List[Segment]: the rendered segments.
+    """
 
-    print(text, spans)
+    text, spans = parse_markup(string, emoji=emoji)
+    return render_spans(text, spans, style=style)
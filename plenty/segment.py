@@ -1,18 +1,29 @@
-from typing import TYPE_CHECKING, Iterable, List, Optional, Generator
+from typing import TYPE_CHECKING, Iterable, List, Optional, Generator, Union
 
-from .str_utils import cell_len, set_cell_size, chop_cells
-from .style import Style
+from .str_utils import cell_len, set_cell_size, chop_cells, is_single_cell
+from .style import Style, markup_cell_len
 
 
 if TYPE_CHECKING:
     from .console import Console
+    from .text import Text
 
 
 class Segment:
+    """A piece of text with an optional style.
+
+    Segments are treated as immutable, which lets the cell length be
+    computed lazily once and cached on the instance.
+    """
+
+    __slots__ = ("text", "style", "_length", "_cell_len", "_cell_len_without_tag")
+
     def __init__(self, text: str = "", style: Optional[Style] = None) -> None:
         self.text = text
         self.style = style
         self._length = len(text)
+        self._cell_len: Optional[int] = None
+        self._cell_len_without_tag: Optional[int] = None
 
     def __render__(self, console: "Console") -> Generator[str, None, None]:
         if self.style:
@@ -30,12 +41,37 @@ class Segment:
         return f"<Segment {self.text!r} style='{str(self.style)}' >"
 
     @property
-    def cell_len(self):
-        return cell_len(Style.plain(self.text))
+    def cell_len(self) -> int:
+        if self._cell_len is None:
+            text = self.text
+            # Printable ASCII can't contain an escape sequence, skip the strip.
+            if is_single_cell(text):
+                self._cell_len = self._length
+            else:
+                self._cell_len = cell_len(Style.plain(text))
+        return self._cell_len
 
     @property
-    def cell_len_without_tag(self):
-        return cell_len(Style.clear_text(self.text))
+    def cell_len_without_tag(self) -> int:
+        if self._cell_len_without_tag is None:
+            self._cell_len_without_tag = markup_cell_len(self.text)
+        return self._cell_len_without_tag
+
+    @classmethod
+    def make(
+        cls, texts: Iterable[str], style: Optional[Style] = None
+    ) -> List["Segment"]:
+        """Make a segment for each text, all sharing the same style.
+
+        Args:
+            texts (Iterable[str]): The texts of the segments.
+            style (Style, optional): Style of every segment. Defaults to None.
+
+        Returns:
+            List[Segment]: The new segments.
+        """
+
+        return [cls(text, style) for text in texts]
 
     @classmethod
     def line(cls) -> "Segment":
@@ -45,7 +81,7 @@ class Segment:
     @classmethod
     def split_and_crop_lines(
         cls,
-        segments: Iterable["Segment"],
+        segments: Iterable[Union["Segment", "Text"]],
         length: int,
         style: Optional[Style] = None,
         pad: bool = True,
@@ -55,7 +91,8 @@ class Segment:
 
         Args:
             segments (Iterable[Segment]): An iterable of segments, probably
-                generated from console.render.
+                generated from console.render. May hold `Text`, which is
+                split on its plain string.
             length (int): Desired line length.
             style (Style, optional): Style to use for any padding.
             pad (bool): Enable padding of lines that are less than `length`.
@@ -63,6 +100,8 @@ class Segment:
         Returns:
             Iterable[List[Segment]]: An iterable of lines of segments.
         """
+        from .text import Text
+
         line: List[Segment] = []
         append = line.append
 
@@ -70,7 +109,19 @@ class Segment:
         new_line_segment = cls("\n")
 
         for segment in segments:
-            if "\n" in segment.text:
+            if isinstance(segment, Text):
+                *text_lines, last_line = segment.split("\n")
+                for text_line in text_lines:
+                    line.extend(text_line.render())
+                    cropped_line = adjust_line_length(
+                        line, length, style=style, pad=pad
+                    )
+                    if include_new_lines:
+                        cropped_line.append(new_line_segment)
+                    yield cropped_line
+                    del line[:]
+                line.extend(last_line.render())
+            elif "\n" in segment.text:
                 text = segment.text
                 style = segment.style
                 while text:
@@ -1,5 +1,5 @@
 from typing import List, Tuple
-from functools import lru_cache
+from bisect import bisect_left
 
 
 WIDTHS: List[Tuple[int, int]] = [
@@ -44,38 +44,90 @@ WIDTHS: List[Tuple[int, int]] = [
 ]
 
 
-@lru_cache(maxsize=1024)
+# Upper bounds of `WIDTHS`, used to bisect the width of a code point.
+_WIDTH_BOUNDS: List[int] = [num for num, _ in WIDTHS]
+_WIDTH_VALUES: List[int] = [wid for _, wid in WIDTHS]
+
+# Code points below this value are looked up in the precomputed table.
+_TABLE_SIZE = 0x10000
+
+
+def _build_width_table(size: int) -> bytes:
+    """Expand `WIDTHS` into a flat table, one byte per code point."""
+
+    table = bytearray(size)
+    start = 0
+    for num, wid in WIDTHS:
+        if start >= size:
+            break
+        end = min(num + 1, size)
+        table[start:end] = bytes((wid,)) * (end - start)
+        start = end
+    if start < size:
+        table[start:] = b"\x01" * (size - start)
+
+    table[0xE] = table[0xF] = 0
+    return bytes(table)
+
+
+_WIDTH_TABLE: bytes = _build_width_table(_TABLE_SIZE)
+
+
+def _bisect_width(r: int) -> int:
+    """Gets the width of a code point outside the precomputed table."""
+
+    idx = bisect_left(_WIDTH_BOUNDS, r)
+    return _WIDTH_VALUES[idx] if idx < len(_WIDTH_VALUES) else 1
+
+
 def get_width(r: int) -> int:
     """Gets the width occupied by characters on the command line."""
 
-    if r in {0xE, 0xF}:
-        return 0
-    return next((wid for num, wid in WIDTHS if r <= num), 1)
+    if r < _TABLE_SIZE:
+        return _WIDTH_TABLE[r]
+    return _bisect_width(r)
 
 
 def get_char_width(character: str) -> int:
     return get_width(ord(character))
 
 
+def is_single_cell(text: str) -> bool:
+    """Return True if every character of text takes exactly one cell.
+
+    Printable ASCII is always one cell wide, so the length of such text
+    is its cell length.
+    """
+
+    return text.isascii() and text.isprintable()
+
+
 def cell_len(cell: str) -> int:
-    return sum(get_char_width(ch) for ch in cell)
+    if cell.isascii() and cell.isprintable():
+        return len(cell)
+
+    table = _WIDTH_TABLE
+    return sum(
+        table[r] if r < _TABLE_SIZE else _bisect_width(r) for r in map(ord, cell)
+    )
 
 
-# TODO: This is inefficient
 # TODO: This might not work with CWJ type characters
 def chop_cells(text: str, max_size: int, position: int = 0) -> List[str]:
     """Break text in to equal (cell) length strings."""
+    if max_size > 0 and text.isascii() and text.isprintable():
+        first = max(max_size - position, 0)
+        return [text[:first]] + [
+            text[i : i + max_size] for i in range(first, len(text), max_size)
+        ]
+
     _get_character_cell_size = get_char_width
-    characters = [
-        (character, _get_character_cell_size(character)) for character in text
-    ][::-1]
     total_size = position
     lines: List[List[str]] = [[]]
     append = lines[-1].append
 
-    pop = characters.pop
-    while characters:
-        character, size = pop()
+    for character in text:
+        size = _get_character_cell_size(character)
         if total_size + size > max_size:
             lines.append([character])
             append = lines[-1].append
@@ -89,28 +141,28 @@ def chop_cells(text: str, max_size: int, position: int = 0) -> List[str]:
 def set_cell_size(text: str, total: int) -> str:
     """Set the length of a string to fit within given number of cells."""
 
+    if text.isascii() and text.isprintable():
+        size = len(text)
+        if size < total:
+            return text + " " * (total - size)
+        return text[: max(total, 0)] if size > total else text
+
     cell_size = cell_len(text)
     if cell_size == total:
         return text
     if cell_size < total:
         return text + " " * (total - cell_size)
 
-    start = 0
-    end = len(text)
-
-    # Binary search until we find the right size
-    while True:
-        pos = (start + end) // 2
-        before = text[: pos + 1]
-        before_len = cell_len(before)
-        if before_len == total + 1 and cell_len(before[-1]) == 2:
-            return f"{before[:-1]} "
-        if before_len == total:
-            return before
-        if before_len > total:
-            end = pos
-        else:
-            start = pos
+    # Walk until the next character no longer fits, a double width
+    # character split by the edge is replaced with a space.
+    _get_character_cell_size = get_char_width
+    size = 0
+    for index, character in enumerate(text):
+        char_size = _get_character_cell_size(character)
+        if size + char_size > total:
+            return text[:index] + " " * (total - size)
+        size += char_size
+    return text
 
 
 def wrap_color_str(line: str, width: int) -> List[str]:
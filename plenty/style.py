@@ -1,9 +1,11 @@
-from typing import List, Optional, Match, Pattern, Union
+from typing import List, Optional, Match, Pattern, Tuple, Union
 import re
 
 from plenty.color import Color, Colorable
 from plenty.effect import TextEffect
 
+from ._lru_cache import LRUCache
+from .str_utils import cell_len
 from .errors import StyleSyntaxError
 
 
@@ -21,17 +23,39 @@ from .errors import StyleSyntaxError
 # Must keep has one of font style or color for making sure can right render.
 # If ignore the two both, it will do nothing.
 # Only '`' with consecutive beginning and ending will be considered part of the content.
+#
+# The lookahead skips the positions which can't start a markup, and a font
+# style is only read from the start of a word, the matches are the same.
 _STYLE_RE: Pattern[str] = re.compile(
-    r"(([a-z]+|\((?:[a-z\s],?)+\))?`(`*.*?`*)`(?:<([a-zA-Z_]+|#[0-9a-fA-F]{6})?(?:,([a-zA-Z_]+|#[0-9a-fA-F]{6}))?>)?)",
+    r"(?=[a-z(`])(((?<![a-z])[a-z]+|\((?:[a-z\s],?)+\))?`(`*.*?`*)`(?:<([a-zA-Z_]+|#[0-9a-fA-F]{6})?(?:,([a-zA-Z_]+|#[0-9a-fA-F]{6}))?>)?)",
     re.M | re.S,  # allow multi lines.
 )
 
 _STYLE_ANSI_RE: Pattern[str] = re.compile(r"\033\[\d+;\d?;?\d*;?\d*;?\d*m|\033\[\d+m")
 
+# Style markup (groups 1-5) or an ANSI code, measured in one scan.
+_MARKUP_RE: Pattern[str] = re.compile(
+    f"{_STYLE_RE.pattern}|{_STYLE_ANSI_RE.pattern}", re.M | re.S
+)
+
 # [yellow]Today[/yellow] is a nice [red]day[/red]
 
 
+def _make_effect_ansi(attributes: int) -> str:
+    sgr = [TextEffect.Code_Map[bit] for bit in range(6) if attributes & (1 << bit)]
+    return f"{TextEffect.START}{TextEffect.SEP.join(sgr)}{TextEffect.END}"
+
+
+# The SGR of every combination of text effects, indexed by the attribute bits.
+_EFFECT_ANSI: Tuple[str, ...] = tuple(_make_effect_ansi(bits) for bits in range(64))
+
+
 class Style(object):
+    # Parsed styles, shared by every caller of `parse` with the same definition.
+    parse_cache: LRUCache[str, "Style"] = LRUCache(maxsize=1024)
+    # Combined styles, keyed on the identity of the pair of styles.
+    combine_cache: LRUCache[Tuple["Style", "Style"], "Style"] = LRUCache(maxsize=1024)
+
     def __init__(
         self,
         *,
@@ -70,6 +94,7 @@ class Style(object):
 
         self._style_definition: Optional[str] = None
         self._ansi: Optional[str] = None
+        self._ansi_true_color = False
         self._null = not (self._set_attributes or color or bg_color)
 
     def __str__(self) -> str:
@@ -104,14 +129,10 @@ class Style(object):
         return self._style_definition
 
     def _make_ansi_code(self) -> str:
-        if self._ansi is None:
-            sgr: List[str] = []
-            fx_map = TextEffect.Code_Map
-
-            if attributes := self._set_attributes & self._attributes:
-                sgr.extend(fx_map[bit] for bit in range(6) if attributes & (1 << bit))
-
-            self._ansi = f"{TextEffect.START}{TextEffect.SEP.join(sgr)}{TextEffect.END}"
+        # Remake the code when `Color.TRUE_COLOR` is toggled.
+        if self._ansi is None or self._ansi_true_color != Color.TRUE_COLOR:
+            self._ansi_true_color = Color.TRUE_COLOR
+            self._ansi = _EFFECT_ANSI[self._set_attributes & self._attributes]
             if self.color:
                 self._ansi += Color.fg(self.color).escape
             if self.bg_color:
@@ -129,14 +150,27 @@ class Style(object):
         print(self.render(text))
 
     def __add__(self, style: Optional["Style"]) -> "Style":
-        if not (isinstance(style, Style) or Style is None):
+        if not (isinstance(style, Style) or style is None):
             return NotImplemented
 
         if style is None or style._null:
             return self
+        if self._null:
+            return style
+
+        cache = self.combine_cache
+        key = (self, style)
+        new_style = cache.get(key)
+        if new_style is None:
+            new_style = self._combine(style)
+            new_style._make_ansi_code()
+            new_style = cache.set(key, new_style)
+        return new_style
 
+    def _combine(self, style: "Style") -> "Style":
         new_style: Style = self.__new__(Style)
         new_style._ansi = None
+        new_style._ansi_true_color = False
         new_style._style_definition = None
         new_style.color = style.color or self.color
         new_style.bg_color = style.bg_color or self.bg_color
@@ -144,7 +178,7 @@ class Style(object):
             style._attributes & style._set_attributes
         )
         new_style._set_attributes = self._set_attributes | style._set_attributes
-        new_style._null = style._null or self._null
+        new_style._null = style._null and self._null
 
         return new_style
 
@@ -155,6 +189,19 @@ class Style(object):
 
     @classmethod
     def parse(cls, style_definition: str) -> "Style":
+        """Parse a style definition, like: 'bold red on white'.
+
+        The result is cached in `Style.parse_cache`, so the same definition
+        always gets the same Style instance, which must not be modified.
+        """
+
+        style = cls.parse_cache.get(style_definition)
+        if style is None:
+            style = cls.parse_cache.set(style_definition, cls._parse(style_definition))
+        return style
+
+    @classmethod
+    def _parse(cls, style_definition: str) -> "Style":
         FX_ATTRIBUTES = TextEffect.Supports
         color = ""
         bg_color = ""
@@ -192,41 +239,7 @@ class Style(object):
     @staticmethod
     def render_style(_msg: str, /, *, _style_sub=_STYLE_RE.sub) -> str:
         def do_replace(match: Match[str]) -> str:
-            raw, fx_tag, content, color_code, bg_color_code = match.groups()
-            # print(raw, fx_tag, content, color_code, bg_color_code)
-
-            if not color_code and not fx_tag and not bg_color_code:
-                return raw
-
-            try:
-                if fx_tag is None:
-                    # No fx then get empty.
-                    font_style = ""
-                elif fx_tag.startswith("(") and fx_tag.endswith(")"):
-                    # Has multi fx tags.
-                    fx_tag = fx_tag[1:-1]
-                    font_style = "".join(
-                        TextEffect.by_name(fx_code.strip())
-                        for fx_code in fx_tag.split(",")
-                    )
-                else:
-                    # Only one.
-                    font_style = TextEffect.by_name(fx_tag)
-
-                # Get color hex.
-                if color_code and color_code.startswith("#"):
-                    color_style = Color.fg(color_code)
-                else:
-                    color_style = Color.by_name(color_code, depth="fg")
-
-                if bg_color_code and bg_color_code.startswith("#"):
-                    bg_color_style = Color.bg(bg_color_code)
-                else:
-                    bg_color_style = Color.by_name(bg_color_code, depth="bg")
-
-                return f"{font_style}{color_style}{bg_color_style}{content}\033[0m"
-            except KeyError:
-                return raw
+            return render_style_markup(*match.groups())
 
         return _style_sub(do_replace, _msg)
 
@@ -247,6 +260,81 @@ class Style(object):
         return cls.plain(cls.remove_style(_msg))
 
 
+def markup_cell_len(text: str) -> int:
+    """Get the cells of text as shown, without style markup and ANSI codes.
+
+    Same as `cell_len(Style.clear_text(text))`, but in one scan which only
+    slices out the visible pieces.
+    """
+
+    if "`" not in text and "\033" not in text:
+        return cell_len(text)
+
+    width = 0
+    position = 0
+    for match in _MARKUP_RE.finditer(text):
+        start = match.start()
+        if start > position:
+            width += cell_len(text[position:start])
+        position = match.end()
+
+        raw, fx, content, color, bg_color = match.groups()
+        if raw is None:
+            # An ANSI code.
+            continue
+        if fx or color or bg_color:
+            raw = content
+        if "\033" in raw:
+            raw = _STYLE_ANSI_RE.sub("", raw)
+        width += cell_len(raw)
+
+    if position < len(text):
+        width += cell_len(text[position:])
+    return width
+
+
+def render_style_markup(
+    raw: str,
+    fx_tag: Optional[str],
+    content: str,
+    color_code: Optional[str],
+    bg_color_code: Optional[str],
+) -> str:
+    """Render one style markup matched by `_STYLE_RE`, or keep it raw."""
+
+    if not color_code and not fx_tag and not bg_color_code:
+        return raw
+
+    try:
+        if fx_tag is None:
+            # No fx then get empty.
+            font_style = ""
+        elif fx_tag.startswith("(") and fx_tag.endswith(")"):
+            # Has multi fx tags.
+            fx_tag = fx_tag[1:-1]
+            font_style = "".join(
+                TextEffect.by_name(fx_code.strip()) for fx_code in fx_tag.split(",")
+            )
+        else:
+            # Only one.
+            font_style = TextEffect.by_name(fx_tag)
+
+        # Get color hex.
+        if color_code and color_code.startswith("#"):
+            color_style = Color.fg(color_code)
+        else:
+            color_style = Color.by_name(color_code, depth="fg")
+
+        if bg_color_code and bg_color_code.startswith("#"):
+            bg_color_style = Color.bg(bg_color_code)
+        else:
+            bg_color_style = Color.by_name(bg_color_code, depth="bg")
+
+        return f"{font_style}{color_style}{bg_color_style}{content}\033[0m"
+    except KeyError:
+        return raw
+
+
 NULL_STYLE = Style()
 
 StyleType = Union[Style, str]
@@ -1,15 +1,54 @@
-from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Tuple, Union
-from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from dataclasses import dataclass, field, replace
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+import os
 
 from ._table import BaseTb
-from .style import Style, StyleType
+from .color import Color
+from .style import Style, StyleType, markup_cell_len
 from .segment import Segment
+from .text import Text
 from .ratio import ratio_reduce
 from ._loop import loop_first_last, loop_last
 
 if TYPE_CHECKING:
     from .console import Console
 
+# The (cell, style) of each column of a row.
+_RowCells = List[Tuple[Union[str, Text], Style]]
+
+
+def _cell_width(cell: Union[str, Text]) -> int:
+    """Get the visible width of a cell, ignoring style markup."""
+
+    if isinstance(cell, Text):
+        return cell.cell_len
+    return markup_cell_len(cell)
+
+
+def _to_cell(value: Any) -> Any:
+    """Make a cell from a row value."""
+
+    if value is None:
+        return ""
+    return value if isinstance(value, (str, Text)) else str(value)
+
 
 @dataclass
 class Column(object):
@@ -23,8 +62,20 @@ class Column(object):
 
     no_wrap: bool = False
 
+    # Fixed width of the column, skips measuring the cells.
+    width: Optional[int] = None
+
     _cells: List = field(default_factory=list)
 
+    # The max width of the cells, kept up to date as cells are added.
+    _cells_width: int = 0
+
+    def _add_cell(self, cell: Any) -> None:
+        self._cells.append(cell)
+        width = _cell_width(cell)
+        if width > self._cells_width:
+            self._cells_width = width
+
 
 @dataclass
 class Row:
@@ -35,10 +86,17 @@ class Row:
 
 @dataclass
 class Table(BaseTb):
+    # The number of streamed rows measured to decide the column widths.
+    stream_sample: int = 100
+
     def __post_init__(self):
         self._columns: List[Column] = []
         self._rows: List[Row] = []
 
+        # Rows fed by `add_rows`, consumed lazily when rendering.
+        self._row_sources: List[Tuple[Iterator[Iterable[Any]], Row]] = []
+        self._stream_buffer: List[Tuple[List[Any], Row]] = []
+
     @property
     def _extra_width(self) -> int:
         width = 0
@@ -55,14 +113,18 @@ class Table(BaseTb):
         header_style: Optional[StyleType] = "bold",
         style: Optional[StyleType] = None,
         no_wrap: bool = False,
+        width: Optional[int] = None,
     ) -> None:
         column = Column(
             header=header,
             header_style=header_style or "",
             style=style or "",
             no_wrap=no_wrap,
+            width=width,
             _index=len(self._columns),
         )
+        # The rows added so far have an empty cell in it.
+        column._cells.extend([""] * len(self._rows))
 
         self._columns.append(column)
 
@@ -78,19 +140,62 @@ class Table(BaseTb):
         for idx, cell in enumerate(cells):
             if idx == len(columns):
                 column = Column(_index=idx)
-                for _ in self._rows:
-                    column._cells.append("")
+                column._cells.extend([""] * len(self._rows))
                 columns.append(column)
             else:
                 column = columns[idx]
 
-            if cell is None:
-                column._cells.append("")
-            else:
-                column._cells.append(cell)
+            column._add_cell(_to_cell(cell))
 
         self._rows.append(Row(style=style or "", end_section=end_section))
 
+    def add_rows(
+        self, rows: Iterable[Iterable[Any]], style: Optional[StyleType] = None
+    ) -> None:
+        """Add rows from an iterable, which is consumed lazily when rendering.
+
+        Only the first `stream_sample` rows are held in memory to measure the
+        columns, use the `width` of a column to skip the measure. Streamed
+        rows are rendered after the rows added by `add_row`, values beyond the
+        columns known after the sample are dropped.
+
+        Args:
+            rows (Iterable[Iterable[Any]]): The rows, like a DB cursor.
+            style (StyleType, optional): Style of these rows. Defaults to None.
+        """
+
+        self._row_sources.append((iter(rows), Row(style=style or "")))
+
+    def _iter_stream(self) -> Iterator[Tuple[List[Any], Row]]:
+        """Iterate the rows of all sources, consuming them."""
+
+        sources = self._row_sources
+        while sources:
+            source, row = sources[0]
+            for values in source:
+                yield [_to_cell(value) for value in values], row
+            sources.pop(0)
+
+    def _prefetch_stream(self) -> None:
+        """Buffer the sample of streamed rows and make their columns."""
+
+        if not self._row_sources:
+            return
+
+        buffer = self._stream_buffer
+        buffer.extend(islice(self._iter_stream(), self.stream_sample - len(buffer)))
+
+        columns = self._columns
+        for cells, _ in buffer:
+            for idx in range(len(columns), len(cells)):
+                columns.append(Column(_index=idx, _cells=[""] * len(self._rows)))
+
+            # Fold the sample into the widths, the sample is only measured once.
+            for column, cell in zip(columns, cells):
+                width = _cell_width(cell)
+                if width > column._cells_width:
+                    column._cells_width = width
+
     def get_row_style(self, console: "Console", index: int) -> Style:
         """Get current row style."""
 
@@ -101,27 +206,18 @@ class Table(BaseTb):
 
         return style
 
-    def _get_cells(self, console: "Console", column: Column) -> List[Segment]:
-        raw_cells = []
-
-        if self.show_header:
-            raw_cells.append(
-                Segment(column.header, console.get_style(column.header_style or ""))
-            )
-
-        cell_style = console.get_style(column.style or "")
-        raw_cells.extend(Segment(cell, cell_style) for cell in column._cells)
-        return raw_cells
-
     def _measure_column(
         self, console: "Console", column: Column, max_width: int
     ) -> int:
         if max_width < 1:
             return 0
+        if column.width is not None:
+            return column.width
 
-        cells = self._get_cells(console, column)
-
-        return max(cell.cell_len_without_tag for cell in cells)
+        width = column._cells_width
+        if self.show_header:
+            width = max(width, _cell_width(column.header))
+        return width
 
     def _calc_column_widths(self, console: "Console", max_width: int) -> List[int]:
         columns = self._columns
@@ -144,13 +240,75 @@ class Table(BaseTb):
 
         return widths
 
-    def _render(self, console: "Console", widths: List[int]) -> Generator:
+    def _iter_rows(
+        self, console: "Console"
+    ) -> Iterator[Tuple[_RowCells, Optional[Row]]]:
+        """Lazily generate the (cell, style) of each row, starting with the header."""
+
+        columns = self._columns
+        get_style = console.get_style
+
+        if self.show_header:
+            yield [
+                (column.header, get_style(column.header_style or ""))
+                for column in columns
+            ], None
+
+        cell_styles = [get_style(column.style or "") for column in columns]
+        for index, row in enumerate(self._rows):
+            yield [
+                (column._cells[index], cell_style)
+                for column, cell_style in zip(columns, cell_styles)
+            ], row
+
+        # Streamed rows, the sample first, then the rest of the sources.
+        column_count = len(columns)
+        buffer = self._stream_buffer
+        while buffer:
+            cells, row = buffer.pop(0)
+            yield self._stream_cells(cells, cell_styles, column_count), row
+        for cells, row in self._iter_stream():
+            yield self._stream_cells(cells, cell_styles, column_count), row
+
+    @staticmethod
+    def _stream_cells(
+        cells: List[Any], cell_styles: List[Style], column_count: int
+    ) -> _RowCells:
+        if len(cells) < column_count:
+            cells.extend([""] * (column_count - len(cells)))
+        return list(zip(cells, cell_styles))
+
+    def _render(
+        self,
+        console: "Console",
+        widths: List[int],
+        render_rows: Optional[Callable[..., Iterable]] = None,
+    ) -> Generator:
+        border_style = console.get_style(self.border_style or "")
+        _box = self.box.substitute(console) if self.box else None
+        new_line = Segment.line()
+
+        if _box and self.show_edge:
+            yield Segment(_box.get_top(widths), border_style)
+            yield new_line
+        render_rows = render_rows or self._render_rows
+        yield from render_rows(
+            console, widths, loop_first_last(self._iter_rows(console))
+        )
+        if _box and self.show_edge:
+            yield Segment(_box.get_bottom(widths), style=border_style)
+            yield new_line
+
+    def _render_rows(
+        self,
+        console: "Console",
+        widths: List[int],
+        rows: Iterable[Tuple[bool, bool, Tuple[_RowCells, Optional[Row]]]],
+    ) -> Generator:
+        """Render rows given as (first, last, (cells, row)), without the edges."""
 
         border_style = console.get_style(self.border_style or "")
-        _columns_cells = [self._get_cells(console, column) for column in self._columns]
-        row_cells = list(zip(*_columns_cells))
 
-        columns = self._columns
         show_edge = self.show_edge
         show_lines = self.show_lines
         show_header = self.show_header
@@ -176,38 +334,26 @@ class Table(BaseTb):
                     Segment(_box.mid_vertical, border_style),
                 ),
             ]
-            if show_edge:
-                yield Segment(_box.get_top(widths), border_style)
-                yield new_line
         else:
             box_segments = []
 
         set_shape = self.set_shape
-        get_row_style = self.get_row_style
         get_style = console.get_style
 
-        for index, (first, last, row_cell) in enumerate(loop_first_last(row_cells)):
+        for first, last, (row_cell, _row) in rows:
             header_row = first and show_header
             footer_row = last
-            row = (
-                self._rows[index - show_header]
-                if (not header_row and not footer_row)
-                else None
-            )
+            row = _row if (not header_row and not footer_row) else None
 
             max_height = 1
             cells: List = []
-            if header_row or footer_row:
+            if row is None:
                 row_style = Style.null()
             else:
-                row_style = get_style(
-                    get_row_style(console, index - 1 if show_header else index)
-                )
+                row_style = get_style(row.style)
 
-            for width, cell, column in zip(widths, row_cell, columns):
-                lines = console.render_lines(
-                    cell.text, width, style=cell.style + row_style
-                )
+            for width, (cell, cell_style) in zip(widths, row_cell):
+                lines = console.render_lines(cell, width, style=cell_style + row_style)
                 max_height = max(max_height, len(lines))
                 cells.append(lines)
 
@@ -257,12 +403,94 @@ class Table(BaseTb):
                     )
                     yield new_line
 
-        if _box and show_edge:
-            yield Segment(_box.get_bottom(widths), style=border_style)
-            yield new_line
+    def _render_rows_parallel(
+        self,
+        console: "Console",
+        widths: List[int],
+        rows: Iterable[Tuple[bool, bool, Tuple[_RowCells, Optional[Row]]]],
+        processes: Optional[int],
+        chunk_rows: int,
+    ) -> Iterator[bytes]:
+        """Render slices of rows in a pool of processes, yielding them in order."""
+
+        # The worker renders with a copy of the table settings, without the cells.
+        # Its box is substituted for this console already, the console of the
+        # worker doesn't know the encoding and system of this one.
+        box = self.box.substitute(console) if self.box else None
+        table = replace(self, box=box)
+        initargs = (table, widths, console.encoding, Color.TRUE_COLOR)
+        max_pending = 2 * (processes or os.cpu_count() or 1)
+
+        rows = iter(rows)
+        with ProcessPoolExecutor(
+            processes, initializer=_init_render_worker, initargs=initargs
+        ) as executor:
+            pending: Deque["Future[bytes]"] = deque()
+            while True:
+                chunk = list(islice(rows, chunk_rows))
+                if not chunk:
+                    break
+                pending.append(executor.submit(_render_rows_chunk, chunk))
+                # Bounded, so the rendered output doesn't pile up in memory.
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def render_parallel(
+        self,
+        console: "Console",
+        processes: Optional[int] = None,
+        chunk_rows: int = 10_000,
+    ) -> Iterator[bytes]:
+        """Render the table in a pool of processes, to encoded chunks in order.
+
+        The column widths are measured once up front, then each slice of
+        chunk_rows rows is rendered and encoded by a worker process. The cells
+        are sent to the workers, so they should be str, Text or picklable.
+
+        Args:
+            console (Console): The console to render for.
+            processes (int, optional): The number of worker processes.
+                Defaults to None, the number of CPUs.
+            chunk_rows (int, optional): The rows rendered by a worker at a
+                time. Defaults to 10000.
+
+        Yields:
+            bytes: The output, encoded in `console.encoding`.
+
+        Example:
+            >>> for chunk in table.render_parallel(console):
+            ...     console.write_bytes(chunk)
+        """
+
+        encoding = console.encoding
+        render_rows = partial(
+            self._render_rows_parallel, processes=processes, chunk_rows=chunk_rows
+        )
+
+        # The title and the edges are rendered here, between the chunks.
+        text: List[str] = []
+        for part in self._render_table(console, render_rows):
+            if isinstance(part, bytes):
+                if text:
+                    yield "".join(text).encode(encoding)
+                    text = []
+                yield part
+            else:
+                text.extend(console.render(part))
+        if text:
+            yield "".join(text).encode(encoding)
 
     def __render__(self, console: "Console") -> Generator:
+        yield from self._render_table(console)
 
+    def _render_table(
+        self,
+        console: "Console",
+        render_rows: Optional[Callable[..., Iterable]] = None,
+    ) -> Generator:
+        self._prefetch_stream()
         if not self._columns:
             yield Segment("\n")
             return
@@ -288,7 +516,7 @@ class Table(BaseTb):
                 (table_width - len(self.title)) // 2 * " " + self.title + "\n",
                 style=console.get_style(self.title_style or ""),
             )
-        yield from self._render(console, widths)
+        yield from self._render(console, widths, render_rows)
         if self.caption:
             yield render_annotation(
                 (table_width - len(self.caption)) // 2 * " " + self.caption + "\n",
@@ -296,6 +524,34 @@ class Table(BaseTb):
             )
 
 
+# The table, widths, encoding and console of a render worker process.
+_render_worker: Optional[Tuple[Table, List[int], str, "Console"]] = None
+
+
+def _init_render_worker(
+    table: Table, widths: List[int], encoding: str, true_color: bool
+) -> None:
+    global _render_worker
+    from .console import Console
+
+    Color.TRUE_COLOR = true_color
+    _render_worker = (table, widths, encoding, Console())
+
+
+def _render_rows_chunk(
+    rows: List[Tuple[bool, bool, Tuple[_RowCells, Optional[Row]]]]
+) -> bytes:
+    if _render_worker is None:
+        raise RuntimeError("render worker not initialised")
+    table, widths, encoding, console = _render_worker
+
+    segments = table._render_rows(console, widths, rows)
+    text = "".join(
+        [string for segment in segments for string in segment.__render__(console)]
+    )
+    return text.encode(encoding)
+
+
 @dataclass
 class Unit(object):
     _index: int = 0
@@ -0,0 +1,199 @@
+from typing import TYPE_CHECKING, Generator, List, Optional, Union
+
+from .style import Style, StyleType
+from .segment import Segment
+from .markup import Span, parse_markup, render_spans
+from ._tokenizer import STYLE, tokenize
+from .str_utils import cell_len, chop_cells
+
+
+if TYPE_CHECKING:
+    from .console import Console
+
+
+class Text:
+    """Plain text with style spans, rendered to segments only when output.
+
+    The text holds no markup or ANSI, so measuring, slicing, wrapping and
+    cropping work on the plain string, the spans follow along.
+
+    Args:
+        text (str, optional): The plain text. Defaults to "".
+        style (StyleType, optional): The base style of the text. Defaults to None.
+        spans (List[Span], optional): Styles over parts of the text, a later
+            span wins over an earlier one. Defaults to None.
+    """
+
+    __slots__ = ("plain", "style", "spans", "_cell_len")
+
+    def __init__(
+        self,
+        text: str = "",
+        style: Optional[StyleType] = None,
+        spans: Optional[List[Span]] = None,
+    ) -> None:
+        self.plain = text
+        self.style = Style.parse(style) if isinstance(style, str) else style
+        self.spans: List[Span] = spans or []
+        self._cell_len: Optional[int] = None
+
+    @classmethod
+    def from_markup(
+        cls, markup: str, style: Optional[StyleType] = None, emoji: bool = True
+    ) -> "Text":
+        """Make a text from style markup, like "b`nice`<red> day"."""
+
+        plain: List[str] = []
+        spans: List[Span] = []
+        length = 0
+        for kind, text, _, fx, color, bg_color in tokenize(markup, emoji=emoji):
+            if kind == STYLE and text:
+                sgr = [fx, color, "on" if bg_color else None, bg_color]
+                span_style = Style.parse(" ".join(word for word in sgr if word))
+                spans.append(Span(length, length + len(text), span_style))
+            plain.append(text)
+            length += len(text)
+
+        return cls("".join(plain), style=style, spans=spans)
+
+    @classmethod
+    def from_tags(
+        cls, markup: str, style: Optional[StyleType] = None, emoji: bool = True
+    ) -> "Text":
+        """Make a text from bracket tag markup, like "[bold]nice[/bold] day".
+
+        Raises:
+            MarkupError: the markup is invalid, see `parse_markup`.
+        """
+
+        text, spans = parse_markup(markup, emoji=emoji)
+        return cls(text, style=style, spans=spans)
+
+    def __str__(self) -> str:
+        return self.plain
+
+    def __repr__(self) -> str:
+        return f"<Text {self.plain!r} spans={len(self.spans)} >"
+
+    def __len__(self) -> int:
+        return len(self.plain)
+
+    def __bool__(self) -> bool:
+        return bool(self.plain)
+
+    def __add__(self, text: Union["Text", str]) -> "Text":
+        if not isinstance(text, (Text, str)):
+            return NotImplemented
+
+        new_text = self.copy()
+        new_text.append(text)
+        return new_text
+
+    def __getitem__(self, index: Union[int, slice]) -> "Text":
+        if isinstance(index, int):
+            if index < 0:
+                index += len(self.plain)
+            return self._slice(index, index + 1)
+
+        start, end, step = index.indices(len(self.plain))
+        if step != 1:
+            raise TypeError("Text doesn't support a slice step.")
+        return self._slice(start, end)
+
+    def _slice(self, start: int, end: int) -> "Text":
+        spans = [
+            Span(max(span.start, start) - start, min(span.end, end) - start, span.style)
+            for span in self.spans
+            if span.start < end and span.end > start and span.start < span.end
+        ]
+        return Text(self.plain[start:end], style=self.style, spans=spans)
+
+    @property
+    def cell_len(self) -> int:
+        """The cells of the text, the plain string needs no stripping."""
+
+        if self._cell_len is None:
+            self._cell_len = cell_len(self.plain)
+        return self._cell_len
+
+    def copy(self) -> "Text":
+        return Text(self.plain, style=self.style, spans=self.spans[:])
+
+    def append(self, text: Union["Text", str], style: Optional[StyleType] = None):
+        """Add text to the end, with an optional style over it.
+
+        The base style of an added Text becomes a span under its own spans.
+        """
+
+        start = len(self.plain)
+        if isinstance(text, Text):
+            self.plain += text.plain
+            if text.style and text.plain:
+                self.spans.append(Span(start, len(self.plain), text.style))
+            self.spans.extend(
+                Span(start + span.start, start + span.end, span.style)
+                for span in text.spans
+            )
+        else:
+            self.plain += text
+        self._cell_len = None
+
+        if style:
+            self.stylize(style, start)
+        return self
+
+    def stylize(self, style: StyleType, start: int = 0, end: Optional[int] = None):
+        """Apply a style over plain[start:end]."""
+
+        length = len(self.plain)
+        end = length if end is None else min(end, length)
+        if start < end:
+            if isinstance(style, str):
+                style = Style.parse(style)
+            self.spans.append(Span(start, end, style))
+        return self
+
+    def split(self, separator: str = "\n") -> List["Text"]:
+        """Split the text by separator, like `str.split`."""
+
+        lines = []
+        start = 0
+        plain = self.plain
+        while True:
+            end = plain.find(separator, start)
+            if end == -1:
+                lines.append(self._slice(start, len(plain)))
+                return lines
+            lines.append(self._slice(start, end))
+            start = end + len(separator)
+
+    def wrap(self, width: int) -> List["Text"]:
+        """Wrap the lines of the text to width cells."""
+
+        lines = []
+        for line in self.split("\n"):
+            start = 0
+            for chunk in chop_cells(line.plain, width) or [""]:
+                lines.append(line._slice(start, start + len(chunk)))
+                start += len(chunk)
+        return lines
+
+    def crop(self, width: int) -> "Text":
+        """Keep the first width cells of the text."""
+
+        if self.cell_len <= width:
+            return self
+        chunks = chop_cells(self.plain, width)
+        return self._slice(0, len(chunks[0]) if chunks else 0)
+
+    def render(self, style: Optional[StyleType] = None) -> List[Segment]:
+        """Render the text to segments, over an optional base style."""
+
+        if isinstance(style, str):
+            style = Style.parse(style)
+        if style and self.style:
+            style = style + self.style
+        return render_spans(self.plain, self.spans, style=style or self.style)
+
+    def __render__(self, console: "Console") -> Generator[Segment, None, None]:
+        yield from self.render()
@@ -27,6 +27,8 @@ setup(
     url="",
     packages=find_packages(),
     include_package_data=True,
+    # Built by `make emoji-index`, optional.
+    package_data={"plenty": ["_emoji_codes.idx"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "Programming Language :: Python :: 3.8",
@@ -0,0 +1,117 @@
+import asyncio, gc, io, os
+
+from plenty.async_console import AsyncConsole
+
+
+class FakeWriter:
+    """A stream writer whose drain waits for the test to open it."""
+
+    def __init__(self) -> None:
+        self.writes = []
+        self.opened = asyncio.Event()
+        self.opened.set()
+
+    def write(self, data: bytes) -> None:
+        self.writes.append(data.decode())
+
+    async def drain(self) -> None:
+        await self.opened.wait()
+
+
+def test_echo():
+    async def main():
+        writer = FakeWriter()
+        console = AsyncConsole(writer)
+        await console.echo("a `b`<red>", 1)
+        await console.echo()
+        return writer.writes
+
+    assert asyncio.run(main()) == ["a \033[38;5;196mb\033[0m 1\n"]
+
+
+def test_echo_coalesce():
+    async def main():
+        writer = FakeWriter()
+        writer.opened.clear()
+        console = AsyncConsole(writer)
+
+        first = asyncio.ensure_future(console.echo(0))
+        await asyncio.sleep(0)
+        # Pending while the first waits, written at once after it.
+        for idx in range(1, 4):
+            await console.echo(idx)
+        assert writer.writes == ["0\n"]
+
+        writer.opened.set()
+        await first
+        return writer.writes
+
+    assert asyncio.run(main()) == ["0\n", "1\n2\n3\n"]
+
+
+def test_echo_high_water():
+    async def main():
+        writer = FakeWriter()
+        writer.opened.clear()
+        console = AsyncConsole(writer, high_water=8)
+
+        first = asyncio.ensure_future(console.echo("a"))
+        await asyncio.sleep(0)
+        await console.echo("b")
+        # Over the high water mark, the echo waits for the output.
+        full = asyncio.ensure_future(console.echo("c" * 8))
+        await asyncio.sleep(0.01)
+        assert not full.done()
+
+        writer.opened.set()
+        await asyncio.gather(first, full)
+        return writer.writes
+
+    assert asyncio.run(main()) == ["a\n", "b\n" + "c" * 8 + "\n"]
+
+
+def test_pipe():
+    read_fd, write_fd = os.pipe()
+
+    async def main():
+        with open(write_fd, "wb") as file:
+            console = AsyncConsole(file=file)
+            await asyncio.gather(*(console.echo(idx) for idx in range(100)))
+            await console.aclose()
+            assert os.get_blocking(write_fd)
+
+    asyncio.run(main())
+    with open(read_fd, "rb") as file:
+        assert file.read().decode() == "".join(f"{idx}\n" for idx in range(100))
+
+
+def test_pipe_dropped():
+    read_fd, write_fd = os.pipe()
+
+    async def main():
+        with open(write_fd, "wb") as file:
+            console = AsyncConsole(file=file)
+            await console.echo("a")
+            assert not os.get_blocking(write_fd)
+
+            # Not closed, the blocking mode is restored all the same.
+            del console
+            gc.collect()
+            assert os.get_blocking(write_fd)
+
+    asyncio.run(main())
+    # The pipe of the dropped console isn't closed, no end of file.
+    assert os.read(read_fd, 16) == b"a\n"
+    os.close(read_fd)
+
+
+def test_file():
+    file = io.StringIO()
+
+    async def main():
+        console = AsyncConsole(file=file)
+        await console.echo("`a`<red>")
+        await console.aclose()
+
+    asyncio.run(main())
+    assert file.getvalue() == "\033[38;5;196ma\033[0m\n"
@@ -1,5 +1,12 @@
 import pytest
-from plenty.color import Color, COLOR_CODE
+from plenty.color import (
+    Color,
+    COLOR_CODE,
+    BG_256_ESCAPES,
+    FG_256_ESCAPES,
+    batch_escape_256,
+    batch_true_color_to_256,
+)
 
 
 @pytest.mark.parametrize(
@@ -42,3 +49,61 @@ def test_generator():
     print(repr(Color.by_name("red", depth="aa")))
     print(repr(Color.by_name("#ff0000")))
     print(Color.escape_color(None))
+
+
+def test_registry():
+    red = Color.fg("red")
+    assert Color.fg("red") is red
+    assert Color.bg("red") is not red
+    assert Color.fg([255, 0, 0]) is Color.fg((255, 0, 0))
+
+    Color.TRUE_COLOR = True
+    try:
+        true_red = Color.fg("red")
+        assert true_red is not red
+        assert true_red.escape == "\033[38;2;255;0;0m"
+    finally:
+        Color.TRUE_COLOR = False
+
+    assert Color.fg("red") is red
+    assert red.escape == "\033[38;5;196m"
+
+
+RGB_GRID = [
+    (r, g, b)
+    for r in range(0, 256, 5)
+    for g in range(0, 256, 15)
+    for b in (0, 11, 127, 254, 255)
+]
+
+
+def test_batch_true_color_to_256():
+    wanted = [Color.true_color_to_256(rgb) for rgb in RGB_GRID]
+    assert batch_true_color_to_256(RGB_GRID, use_numpy=False) == wanted
+    assert batch_true_color_to_256(iter(RGB_GRID), use_numpy=False) == wanted
+    assert batch_escape_256(RGB_GRID[:2], depth="bg", use_numpy=False) == [
+        Color.escape_color(r=r, g=g, b=b, depth="bg") for r, g, b in RGB_GRID[:2]
+    ]
+
+
+def test_batch_true_color_to_256_numpy():
+    np = pytest.importorskip("numpy")
+    wanted = batch_true_color_to_256(RGB_GRID, use_numpy=False)
+    assert batch_true_color_to_256(np.array(RGB_GRID), use_numpy=True) == wanted
+    assert batch_true_color_to_256(RGB_GRID, use_numpy=True) == wanted
+    assert batch_true_color_to_256(iter(RGB_GRID), use_numpy=True) == wanted
+    assert batch_true_color_to_256((rgb for rgb in []), use_numpy=True) == []
+
+
+def test_escape_tables():
+    assert len(FG_256_ESCAPES) == len(BG_256_ESCAPES) == 256
+    assert Color.escape_color("#FF0000") == FG_256_ESCAPES[196] == "\033[38;5;196m"
+    assert Color.escape_color("#FF0000", depth="bg") == "\033[48;5;196m"
+
+    Color.TRUE_COLOR = True
+    try:
+        escape = Color.escape_color(r=1, g=2, b=3, depth="bg")
+        assert escape == "\033[48;2;1;2;3m"
+        assert Color.escape_color(r=1, g=2, b=3, depth="bg") is escape
+    finally:
+        Color.TRUE_COLOR = False
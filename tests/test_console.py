@@ -0,0 +1,220 @@
+import gc, io, threading, time
+
+import pytest
+
+import plenty
+from plenty.console import Console, _flush_consoles
+
+
+class CountingStream:
+    def __init__(self) -> None:
+        self.writes = []
+
+    def write(self, text: str) -> int:
+        self.writes.append(text)
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+
+@pytest.fixture
+def stream():
+    return CountingStream()
+
+
+def test_echo_unbuffered(stream):
+    console = Console(file=stream)
+    console.echo("a `b`<red>", 1)
+    console.echo()
+
+    assert stream.writes == ["a \033[38;5;196mb\033[0m 1\n"]
+
+
+def test_echo_stdout(capsys):
+    # sys.stdout at the time of writing, the one of capsys here.
+    console = Console()
+    console.echo("a `b`<red>", 1)
+
+    assert capsys.readouterr().out == "a \033[38;5;196mb\033[0m 1\n"
+
+
+def test_echo_buffer_size(stream):
+    console = Console(buffer_size=8, file=stream)
+    console.echo("1234")
+    assert stream.writes == []
+
+    console.echo("5678")
+    assert stream.writes == ["1234\n5678\n"]
+
+    console.echo("9", flush=True)
+    assert stream.writes == ["1234\n5678\n", "9\n"]
+
+
+def test_batch(stream):
+    console = Console(file=stream)
+    with console.batch():
+        for idx in range(3):
+            console.echo(idx)
+        console.write("end\n")
+        assert stream.writes == []
+
+    assert stream.writes == ["0\n1\n2\nend\n"]
+
+
+def test_flush_interval(stream):
+    console = Console(buffer_size=1 << 20, flush_interval=0.01, file=stream)
+    console.echo("late")
+    assert stream.writes == []
+
+    deadline = time.monotonic() + 2
+    while not stream.writes and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert stream.writes == ["late\n"]
+
+
+def test_flush_at_exit(stream):
+    console = Console(buffer_size=1 << 20, file=stream)
+    console.echo("pending")
+
+    _flush_consoles()
+    assert stream.writes == ["pending\n"]
+
+
+def test_flush_on_collect():
+    file = io.StringIO()
+
+    def work():
+        Console(buffer_size=1 << 20, file=file).echo("pending")
+
+    work()
+    gc.collect()
+    assert file.getvalue() == "pending\n"
+
+
+def test_module_echo(capsys, monkeypatch):
+    monkeypatch.setattr(plenty, "_console", Console())
+    plenty.echo("a", "`b`<red>")
+    plenty.echo()
+
+    assert capsys.readouterr().out == "a \033[38;5;196mb\033[0m\n\n"
+
+
+def test_binary_file():
+    file = io.BytesIO()
+    console = Console(file=file, buffer_size=1 << 16, encoding="utf-8")
+    console.echo("中文 `b`<red>")
+    assert file.getvalue() == b""
+
+    console.flush()
+    assert file.getvalue() == "中文 \033[38;5;196mb\033[0m\n".encode("utf-8")
+    assert console.encoding == "utf-8"
+
+
+def test_text_file(capsys):
+    file = io.StringIO()
+    console = Console(file=file)
+    console.echo("a", "b", sep="-")
+
+    assert file.getvalue() == "a-b\n"
+    assert capsys.readouterr().out == ""
+
+
+def test_writelines():
+    file = io.BytesIO()
+    console = Console(file=file)
+    console.writelines(f"{idx}\n" for idx in range(3))
+
+    assert file.getvalue() == b"0\n1\n2\n"
+
+
+def test_render_outside_lock():
+    file = io.StringIO()
+    console = Console(file=file)
+    rendering, release = threading.Event(), threading.Event()
+
+    class Slow:
+        def __render__(self, console):
+            rendering.set()
+            release.wait(5)
+            yield "slow"
+
+    worker = threading.Thread(target=console.echo, args=(Slow(),))
+    worker.start()
+    assert rendering.wait(5)
+
+    # The slow render doesn't hold the console.
+    console.echo("fast")
+    release.set()
+    worker.join()
+    assert file.getvalue() == "fast\nslow\n"
+
+
+def test_writer_thread():
+    file = io.BytesIO()
+    console = Console(file=file, writer_thread=True)
+
+    def work(worker: int) -> None:
+        for idx in range(100):
+            console.echo(f"{worker}-{idx}")
+
+    workers = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    console.flush()
+
+    lines = file.getvalue().decode().splitlines()
+    assert sorted(lines) == sorted(f"{n}-{idx}" for n in range(4) for idx in range(100))
+    # Lines of one thread keep their order.
+    assert [line for line in lines if line.startswith("0-")] == [
+        f"0-{idx}" for idx in range(100)
+    ]
+
+
+def test_writer_thread_close():
+    file = io.BytesIO()
+    console = Console(file=file, writer_thread=True, buffer_size=1 << 10)
+    console.echo("a")
+    console.flush()
+    writer = console._writer
+    assert writer.is_alive()
+
+    console.echo("b")
+    console.close()
+    assert not writer.is_alive()
+    assert file.getvalue() == b"a\nb\n"
+
+    # Started again by the next flush.
+    console.echo("c", flush=True)
+    console.flush()
+    assert file.getvalue() == b"a\nb\nc\n"
+    console.close()
+
+
+def test_writer_thread_collect():
+    file = io.BytesIO()
+    console = Console(file=file, writer_thread=True, buffer_size=1 << 10)
+    console.echo("a", flush=True)
+    console.echo("b")
+    writer = console._writer
+
+    del console
+    gc.collect()
+    writer.join(5)
+    assert not writer.is_alive()
+    assert file.getvalue() == b"a\nb\n"
+
+
+def test_write_bytes():
+    file = io.StringIO()
+    console = Console(file=file, buffer_size=1 << 10)
+    console.echo("a")
+    console.write_bytes("中文\n".encode(console.encoding))
+    assert file.getvalue() == "a\n中文\n"
+
+    file = io.BytesIO()
+    console = Console(file=file)
+    console.write_bytes(b"abc")
+    assert file.getvalue() == b"abc"
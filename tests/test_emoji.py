@@ -1,5 +1,9 @@
+import os, subprocess, sys
+
 from plenty.emoji import Emoji
 
+_PLENTY_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 
 def test_right_render():
     print(Emoji.render_emoji("Today is a nice day :rainbow:."))
@@ -7,3 +11,53 @@ def test_right_render():
 
 def test_error_render():
     print(Emoji.render_emoji(" Bad emoji :abcde:"))
+
+
+def test_attribute():
+    assert Emoji.rainbow == Emoji.EMOTION["rainbow"] == "🌈"
+    assert Emoji.EMOJI is Emoji.EMOTION
+
+
+def test_import_time():
+    """Importing the console must not load the emoji table."""
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import plenty.console"],
+        cwd=_PLENTY_PATH,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines like: "import time:   self [us] | cumulative | module"
+    cumulative = {}
+    for line in result.stderr.splitlines()[1:]:
+        _, total, module = line.split("|")
+        cumulative[module.strip()] = total.strip()
+
+    print(f"\nimport plenty.console: {cumulative['plenty.console']} us")
+    assert "plenty._emoji_codes" not in cumulative
+
+
+def test_render_fast_path():
+    text = "no emoji code: here"
+    assert Emoji.render_emoji(text) is text
+
+    Emoji.render_cache.clear()
+    wanted = "\U0001f308\ufe0e \U0001f308\ufe0e"
+    for _ in range(2):
+        rendered = Emoji.render_emoji(":rainbow: :rainbow:", default_variant="text")
+        assert rendered == wanted
+    assert Emoji.render_cache.info().hits == 1
+
+
+def test_render_cache_subclass():
+    class Txt(Emoji):
+        EMOTION = {"rainbow": "(rb)"}
+
+    text = ":rainbow: x"
+    assert Emoji.render_emoji(text) == "\U0001f308 x"
+    assert Txt.render_emoji(text) == "(rb) x"
+
+    # Not the output of the old table.
+    Txt.EMOTION = {"rainbow": "~"}
+    assert Txt.render_emoji(text) == "~ x"
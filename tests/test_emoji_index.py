@@ -0,0 +1,40 @@
+import pytest
+
+from plenty._emoji_codes import EMOJI
+from plenty._emoji_index import EmojiIndex, build_index
+from plenty.emoji import Emoji
+
+
+@pytest.fixture(scope="module")
+def index(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("emoji") / "emoji.idx")
+    build_index(EMOJI, path)
+    index = EmojiIndex(path)
+    yield index
+    index.close()
+
+
+def test_same_entries(index: EmojiIndex):
+    assert len(index) == len(EMOJI)
+    assert sorted(index) == sorted(EMOJI)
+    for name, value in EMOJI.items():
+        assert index[name] == value
+
+    assert "not_an_emoji" not in index
+    with pytest.raises(KeyError):
+        index["not_an_emoji"]
+
+
+def test_same_render(index: EmojiIndex, monkeypatch):
+    text = ":rainbow: :thumbs_up-text: :abcde: :Red_Heart: :smile-emoji:"
+    wanted = Emoji.render_emoji(text)
+
+    monkeypatch.setattr(Emoji, "EMOTION", index)
+    assert Emoji.render_emoji(text) == wanted
+
+
+def test_bad_index(tmp_path):
+    path = tmp_path / "bad.idx"
+    path.write_bytes(b"not an index")
+    with pytest.raises(ValueError):
+        EmojiIndex(str(path))
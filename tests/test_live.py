@@ -0,0 +1,92 @@
+import io, os
+
+import pytest
+
+from plenty import console as console_module
+from plenty.console import Console
+from plenty.live import Live
+
+
+@pytest.fixture
+def size(monkeypatch):
+    size = [80, 24]
+    monkeypatch.setattr(
+        console_module, "get_terminal_size", lambda: os.terminal_size(size)
+    )
+    return size
+
+
+def make_live(cell_diff: bool = False):
+    file = io.StringIO()
+    live = Live(Console(file=file), cell_diff=cell_diff)
+
+    def update(renderable) -> str:
+        file.seek(0)
+        file.truncate()
+        live.update(renderable)
+        return file.getvalue()
+
+    return live, file, update
+
+
+def test_line_diff(size):
+    live, file, update = make_live()
+    assert update("a\nb") == "\033[Ka\n\033[Kb\n"
+    # Only the changed line is written, the cursor moves over the others.
+    assert update("a\nc") == "\033[2A\033[1B\033[Kc\n"
+    assert update("a\nc") == ""
+    assert update("x\nc\nd") == "\033[2A\033[Kx\n\033[1B\033[Kd\n"
+    # The lines left over are cleared.
+    assert update("x") == "\033[3A\033[1B\033[J"
+
+
+def test_styled_line(size):
+    live, file, update = make_live()
+    assert update("`a`<red>") == "\033[K\033[38;5;196ma\033[0m\033[0m\n"
+
+
+@pytest.mark.parametrize(
+    "old, new, wanted",
+    [
+        ("time 12:00", "time 12:05", "\033[10G5"),
+        ("count 9 of 10", "count 10 of 10", "\033[7G\033[K10 of 10"),
+        ("名字 1", "名字 2", "\033[6G2"),
+        ("`a`<red>", "`b`<red>", "\033[K\033[38;5;196mb\033[0m\033[0m"),
+    ],
+)
+def test_cell_diff(size, old, new, wanted):
+    live, file, update = make_live(cell_diff=True)
+    update(old)
+    assert update(new) == f"\033[1A{wanted}\n"
+
+
+def test_resize(size):
+    live, file, update = make_live()
+    update("a\nb")
+    size[0] = 40
+    assert update("a\nb") == "\033[2A\033[Ka\n\033[Kb\n"
+
+    # Cropped to the height of the terminal.
+    size[1] = 4
+    assert update("a\nb\nc\nd") == "\033[2A\033[2B\033[Kc\n"
+
+
+def test_crop(size):
+    live, file, update = make_live()
+    size[0] = 10
+    # Cropped, so each line takes one row of the terminal.
+    assert update("x" * 25 + "\nb") == "\033[K" + "x" * 10 + "\n\033[Kb\n"
+    assert update("x" * 25 + "\nc") == "\033[2A\033[1B\033[Kc\n"
+
+    assert update("`abcdefgh`<red>`ijkl`<green>") == (
+        "\033[2A\033[K\033[38;5;196mabcdefgh\033[0m\033[38;5;34mij\033[0m\033[0m\n"
+        "\033[J"
+    )
+    assert update("中文中文中文") == "\033[1A\033[K中文中文中\n"
+
+
+def test_start_stop(size):
+    file = io.StringIO()
+    with Live(Console(file=file)) as live:
+        live.update("a")
+    assert file.getvalue() == "\033[?25l\033[Ka\n\033[?25h"
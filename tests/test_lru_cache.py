@@ -0,0 +1,21 @@
+from plenty._lru_cache import LRUCache
+
+
+def test_lru_cache():
+    cache = LRUCache(maxsize=2)
+    assert cache.set("a", 1) == 1
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    # "b" is the least recently used.
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.set("a", 10) == 1
+    assert cache.info() == (1, 1, 2, 2)
+
+    cache.resize(1)
+    assert len(cache) == 1 and "a" in cache
+
+    cache.clear()
+    assert cache.info() == (0, 0, 1, 0)
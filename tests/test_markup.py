@@ -0,0 +1,138 @@
+import pytest
+
+from plenty.color import Color
+from plenty.console import Console
+from plenty.errors import MarkupError
+from plenty.markup import (
+    MarkupTemplate,
+    Span,
+    compile,
+    markup,
+    parse_markup,
+    render_markup,
+    render_spans,
+)
+from plenty.style import Style
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "b`{status}`<green> {path}",
+        "{0} :rainbow: `{1:>5}`<#FF0000,black>",
+        "no markup {status}",
+        "`{status}`<nope> and b`x`",
+    ],
+)
+def test_template_render(template: str):
+    values = ("OK", 3)
+    named = {"status": "OK", "path": "/index"}
+
+    wanted = Console.render_str(template.format(*values, **named))
+    assert compile(template).render(*values, **named) == wanted
+
+
+def test_template_values_are_plain():
+    template = compile("b`{status}`<green>")
+
+    rendered = template.render(status="`x`<red> :rainbow:")
+    assert "`x`<red> :rainbow:" in rendered
+
+
+def test_template_segments():
+    template = compile("b`{status}`<green> {path}", style="underline")
+
+    segments = template.segments(status="OK", path="/index")
+    wanted = render_markup("b`OK`<green> /index", style="underline")
+    assert [(segment.text, str(segment.style)) for segment in segments] == [
+        (segment.text, str(segment.style)) for segment in wanted
+    ]
+
+    # Auto-numbered fields count over the whole template.
+    template = compile("b`{}`<green> {} {{x}} {:>{}}")
+    segments = template.segments("OK", "path", 3, 2)
+    assert [segment.text for segment in segments] == ["OK", " path {x}  3"]
+    assert "".join(segment.text for segment in segments) == Style.plain(
+        template.render("OK", "path", 3, 2)
+    )
+
+
+def test_template_cache():
+    template = compile("`{status}`<red>")
+
+    assert compile("`{status}`<red>") is template
+    assert template.fields == ("status",)
+
+    Color.TRUE_COLOR = not Color.TRUE_COLOR
+    try:
+        assert compile("`{status}`<red>") is not template
+    finally:
+        Color.TRUE_COLOR = not Color.TRUE_COLOR
+
+
+def test_template_bad_format():
+    with pytest.raises(ValueError):
+        MarkupTemplate("`{status`<red>")
+
+
+def test_parse_markup():
+    string = "Yes, [bold]Today is [red]nice[/red][/bold] [u]:rainbow:"
+    text, spans = parse_markup(string)
+
+    assert text == "Yes, Today is nice 🌈"
+    assert [(span.start, span.end, str(span.style)) for span in spans] == [
+        (5, 18, "bold"),
+        (14, 18, "red"),
+        (19, 20, "underline"),
+    ]
+
+
+def test_markup():
+    segments = markup("[bold]Today [red]is[/red] nice[/bold]!", style="italic")
+
+    assert [(segment.text, str(segment.style)) for segment in segments] == [
+        ("Today ", "bold italic"),
+        ("is", "bold italic red"),
+        (" nice", "bold italic"),
+        ("!", "italic"),
+    ]
+
+
+def test_render_spans_overlap():
+    red, bold = Style.parse("red"), Style.parse("bold")
+    spans = [Span(0, 4, red), Span(2, 6, bold)]
+
+    segments = render_spans("abcdefg", spans)
+    assert [segment.text for segment in segments] == ["ab", "cd", "ef", "g"]
+    assert segments[1].style is red + bold
+
+
+@pytest.mark.parametrize(
+    "string, wanted",
+    [
+        ("[bold][/bold]x", [("x", "none")]),
+        ("a[red]b[bold][/bold]c[/red]", [("a", "none"), ("bc", "red")]),
+        ("[red]x[/red][bold]", [("x", "red")]),
+    ],
+)
+def test_markup_empty_span(string, wanted):
+    _, spans = parse_markup(string)
+    assert all(span.start < span.end for span in spans)
+
+    segments = markup(string)
+    assert [(segment.text, str(segment.style)) for segment in segments] == wanted
+
+
+def test_render_spans_empty():
+    red, bold = Style.parse("red"), Style.parse("bold")
+    segments = render_spans("abc", [Span(0, 3, red), Span(1, 1, bold)])
+    assert [(segment.text, segment.style) for segment in segments] == [("abc", red)]
+
+
+@pytest.mark.parametrize(
+    "string",
+    ["[bold]x[/red]", "x[/bold]", "[bold]x[/]", "[no_such_color]x"],
+)
+def test_markup_error(string: str):
+    with pytest.raises(MarkupError):
+        markup(string)
@@ -0,0 +1,53 @@
+import pytest
+
+from plenty.segment import Segment
+from plenty.str_utils import cell_len
+from plenty.style import Style
+
+
+@pytest.mark.parametrize(
+    ["text", "wanted"],
+    [
+        ("hello", 5),
+        ("中文", 4),
+        ("\033[31mred\033[0m", 3),
+    ],
+)
+def test_cell_len(text: str, wanted: int):
+    segment = Segment(text)
+    assert segment.cell_len == wanted
+    # cached value.
+    assert segment.cell_len == wanted
+
+
+@pytest.mark.parametrize(
+    ["text", "wanted"],
+    [
+        ("hello", 5),
+        ("b`nice`<red> day", 8),
+        ("中`文`<red>", 4),
+        ("a`b`c", 2),
+        ("\033[31mred\033[0m `x`", 7),
+        ("`\033[31mred\033[0m`<red>", 3),
+    ],
+)
+def test_cell_len_without_tag(text: str, wanted: int):
+    segment = Segment(text)
+    assert segment.cell_len_without_tag == wanted
+    assert segment.cell_len_without_tag == cell_len(Style.clear_text(text))
+
+
+def test_make():
+    style = Style.parse("red")
+    segments = Segment.make(["a", "bb", "ccc"], style)
+
+    assert [segment.text for segment in segments] == ["a", "bb", "ccc"]
+    assert all(segment.style is style for segment in segments)
+    assert not hasattr(segments[0], "__dict__")
+
+
+def test_split_and_crop_lines():
+    segments = [Segment("12345\n"), Segment("中文中文中文")]
+    lines = list(Segment.split_and_crop_lines(segments, 4))
+
+    assert ["".join(s.text for s in line) for line in lines] == ["1234", "中文"]
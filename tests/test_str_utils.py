@@ -14,6 +14,37 @@ def test_get_width(chr, wanted):
     assert get_width(ord(chr)) == wanted
 
 
+def test_get_width_matches_ranges():
+    def linear_width(r: int) -> int:
+        if r in {0xE, 0xF}:
+            return 0
+        return next((wid for num, wid in WIDTHS if r <= num), 1)
+
+    points = {0, 0xE, 0xF, 0x10FFFF, 0x110000}
+    for num, _ in WIDTHS:
+        points.update((num - 1, num, num + 1))
+    points.update(range(0, 0x110000, 251))
+
+    for r in points:
+        assert get_width(r) == linear_width(r), r
+
+
+@pytest.mark.parametrize(
+    ["text", "wanted"],
+    [
+        ("", 0),
+        ("hello world", 11),
+        ("tab\there", 8),
+        ("shift\x0e\x0fout", 8),
+        ("del\x7f", 3),
+        ("中文 ok", 7),
+    ],
+)
+def test_cell_len(text, wanted):
+    assert cell_len(text) == wanted
+    assert is_single_cell(text) == (len(text) == wanted and text.isprintable())
+
+
 def test_shorten():
     assert shorten("Hello world!", 9, placeholder="^-^") == "Hello ^-^"
     assert shorten("Hello world!", 9, placeholder="^-^", front=True) == "^-^world!"
@@ -22,6 +53,9 @@ def test_shorten():
 def test_chop_cells():
     assert chop_cells("12345678", 4) == ["1234", "5678"]
     assert chop_cells("12345678", 10) == ["12345678"]
+    assert chop_cells("12345678", 4, position=2) == ["12", "3456", "78"]
+    assert chop_cells("123", 2, position=2) == ["", "12", "3"]
+    assert chop_cells("中文中文", 4) == ["中文", "中文"]
 
 
 @pytest.mark.parametrize(
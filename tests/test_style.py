@@ -2,6 +2,7 @@ import pytest
 
 from plenty.markup import render_markup
 from plenty.style import Style
+from plenty.color import Color
 
 
 class TestStyle:
@@ -81,3 +82,33 @@ class TestStyle:
         style2 = Style(bg_color="red", bold=False, dark=True)
 
         print("\n", style1 + style2)
+
+    def test_style_parse_cache(self):
+        Style.parse_cache.clear()
+
+        style = Style.parse("bold green on red")
+        for _ in range(100):
+            assert Style.parse("bold green on red") is style
+
+        info = Style.parse_cache.info()
+        assert info.hits == 100 and info.misses == 1 and info.currsize == 1
+
+    def test_style_add_cache(self):
+        style1 = Style.parse("green")
+        style2 = Style.parse("on red")
+
+        combined = style1 + style2
+        assert style1 + style2 is combined
+        assert combined._ansi is not None
+        assert Style.null() + style2 is style2
+        assert not (Style.null() + Style(color="red"))._null
+
+    def test_style_true_color_toggle(self):
+        style = Style(color="red")
+        assert style._make_ansi_code().endswith("\033[38;5;196m")
+
+        Color.TRUE_COLOR = True
+        try:
+            assert style._make_ansi_code().endswith("\033[38;2;255;0;0m")
+        finally:
+            Color.TRUE_COLOR = False
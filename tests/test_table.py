@@ -1,7 +1,10 @@
+import io
+
 import pytest
 
 from plenty.console import Console
-from plenty.table import Table, UintTable
+from plenty.table import Table, UintTable, _render_rows_chunk
+from plenty.text import Text
 from plenty import box
 
 
@@ -54,3 +57,103 @@ class TestTableModule:
 
         console = Console()
         console.echo(ut)
+
+
+class TestStreamTable:
+    def make_table(self) -> Table:
+        table = Table(width=40, box=box.ASCII)
+        table.add_column("Idx", style="green")
+        table.add_column("Name")
+        return table
+
+    def test_add_rows(self):
+        console = Console()
+        rows = [(idx, f"name {idx}") for idx in range(20)]
+
+        table = self.make_table()
+        for row in rows:
+            table.add_row(*row)
+
+        stream_table = self.make_table()
+        stream_table.add_rows(iter(rows))
+
+        assert "".join(console.render(stream_table)) == "".join(
+            console.render(table)
+        )
+
+    def test_add_rows_is_lazy(self):
+        pulled = []
+
+        def source():
+            for idx in range(1000):
+                pulled.append(idx)
+                yield idx, None, "extra"
+
+        console = Console()
+        table = self.make_table()
+        table.stream_sample = 10
+        table.add_rows(source())
+
+        render_iter = console.render(table)
+        next(render_iter)
+        assert len(pulled) == 10
+
+        lines = "".join(render_iter).splitlines()
+        assert len(pulled) == 1000
+        # top, header, header row, 1000 rows, bottom
+        assert len(lines) == 1004
+
+
+def test_column_width_tracking():
+    table = Table()
+    table.add_column("Name")
+    table.add_row("`sun`<red> is big")
+    table.add_row("中文")
+    table.add_row("abc", "extra cell")
+
+    name, extra = table._columns
+    assert name._cells_width == len("sun is big")
+    assert extra._cells == ["", "", "extra cell"]
+    assert extra._cells_width == len("extra cell")
+
+
+def test_add_column_after_rows():
+    table = Table()
+    table.add_column("a")
+    table.add_row("1")
+    table.add_column("b")
+    table.add_row("2", "3")
+
+    assert table._columns[1]._cells == ["", "3"]
+    lines = "".join(Console().render(table)).splitlines()
+    # top, header, header row, 2 rows, bottom
+    assert len(lines) == 6
+
+
+@pytest.mark.parametrize(
+    "show_lines, encoding, word",
+    [(False, "utf-8", "中文"), (True, "utf-8", "中文"), (False, "latin-1", "café")],
+)
+def test_render_parallel(show_lines, encoding, word):
+    def make_table():
+        table = Table(title="parallel", caption="end", show_lines=show_lines)
+        table.add_column("Idx", style="green")
+        table.add_column("Name")
+        table.add_row("first", Text.from_markup("`sun`<red> is big"), style="blue")
+        table.add_rows((idx, f"name `{idx}`<yellow> {word}") for idx in range(50))
+        return table
+
+    # Not utf-8, the rows and the edges of both have ASCII borders.
+    console = Console(file=io.BytesIO(), encoding=encoding)
+    expected = "".join(console.render(make_table())).encode(console.encoding)
+
+    chunks = list(make_table().render_parallel(console, processes=2, chunk_rows=7))
+    # Title and top edge, 8 slices of rows, bottom edge and caption.
+    assert len(chunks) == 10
+    assert b"".join(chunks) == expected
+
+
+def test_render_rows_chunk_uninitialised():
+    # Outside a worker process, even with -O.
+    with pytest.raises(RuntimeError):
+        _render_rows_chunk([])
@@ -0,0 +1,83 @@
+import os, signal, threading
+
+import pytest
+
+from plenty import _terminal
+from plenty.console import Console
+
+
+@pytest.fixture
+def queries(monkeypatch):
+    queries = []
+
+    def query_size():
+        queries.append(1)
+        return os.terminal_size((80 + len(queries), 24))
+
+    monkeypatch.setattr(_terminal, "_query_size", query_size)
+    monkeypatch.setattr(_terminal, "_size", None)
+    monkeypatch.setattr(_terminal, "_handler_installed", False)
+    monkeypatch.setattr(_terminal, "_previous_handler", None)
+
+    sigwinch = getattr(signal, "SIGWINCH", None)
+    if sigwinch is not None:
+        handler = signal.getsignal(sigwinch)
+        yield queries
+        signal.signal(sigwinch, handler)
+    else:
+        yield queries
+
+
+def test_shared_size(queries):
+    assert Console().width == 81
+    assert Console().size == (81, 24)
+    assert len(queries) == 1
+
+    _terminal.invalidate()
+    assert Console().width == 82
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="no SIGWINCH")
+def test_sigwinch(queries):
+    called = []
+    signal.signal(signal.SIGWINCH, lambda *args: called.append(args))
+
+    console = Console()
+    assert console.width == 81
+    assert console.width == 81
+
+    os.kill(os.getpid(), signal.SIGWINCH)
+    assert console.width == 82
+    # The handler of the application still runs.
+    assert len(called) == 1
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="no SIGWINCH")
+def test_handler_replaced(queries, monkeypatch):
+    console = Console()
+    assert console.width == 81
+    assert console.width == 81
+
+    # Resizes are missed with the handler of the application, checked again.
+    signal.signal(signal.SIGWINCH, signal.SIG_DFL)
+    monkeypatch.setattr(_terminal, "CHECK_INTERVAL", 0)
+    assert console.width == 82
+    assert signal.getsignal(signal.SIGWINCH) is signal.SIG_DFL
+
+
+def test_check_interval(queries, monkeypatch):
+    widths = []
+
+    def work():
+        console = Console()
+        widths.append(console.width)
+        widths.append(console.width)
+        monkeypatch.setattr(_terminal, "CHECK_INTERVAL", 0)
+        widths.append(console.width)
+
+    # No handler from another thread, the size is checked again in a while.
+    thread = threading.Thread(target=work)
+    thread.start()
+    thread.join()
+    assert widths == [81, 81, 82]
+    assert not _terminal._handler_installed
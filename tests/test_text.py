@@ -0,0 +1,91 @@
+import pytest
+
+from plenty.console import Console
+from plenty.markup import Span, render_markup
+from plenty.segment import Segment
+from plenty.style import Style
+from plenty.table import Table
+from plenty.text import Text
+
+
+def _pieces(segments):
+    return [(segment.text, str(segment.style)) for segment in segments]
+
+
+def test_from_markup():
+    markup = "Today is a b`nice` `day`<green,red>. :rainbow:"
+    text = Text.from_markup(markup, style="italic")
+
+    assert text.plain == "Today is a nice day. 🌈"
+    assert _pieces(text.render()) == _pieces(render_markup(markup, style="italic"))
+
+
+def test_cell_len():
+    text = Text.from_tags("[bold]中文[/bold] abc")
+
+    assert text.cell_len == 8
+    text.append("de", style="red")
+    assert text.cell_len == 10
+
+
+def test_slice():
+    text = Text.from_tags("ab[red]cd[bold]ef[/bold][/red]gh")
+
+    assert _pieces(text[3:7].render()) == [
+        ("d", "red"),
+        ("ef", "bold red"),
+        ("g", "none"),
+    ]
+    assert text[-1].plain == "h"
+    with pytest.raises(TypeError):
+        text[::2]
+
+
+def test_empty_spans():
+    text = Text.from_markup("a ``<red> b")
+    assert text.spans == []
+    assert _pieces(text.render()) == [("a  b", "none")]
+
+    text = Text.from_tags("[red]x[/red][bold]")
+    assert _pieces(text.render()) == [("x", "red")]
+
+    red = Style.parse("red")
+    text = Text("abcde", spans=[Span(3, 3, red), Span(1, 4, red)])
+    assert text[0:5].spans == [Span(1, 4, red)]
+    assert _pieces(text.render()) == [("a", "none"), ("bcd", "red"), ("e", "none")]
+
+
+def test_split_wrap_crop():
+    text = Text("abc\ndefgh", style="red")
+    text.stylize("bold", 2, 5)
+
+    assert [line.plain for line in text.split()] == ["abc", "defgh"]
+    assert [line.plain for line in text.wrap(2)] == ["ab", "c", "de", "fg", "h"]
+    assert _pieces(text.crop(3).render()) == [("ab", "red"), ("c", "bold red")]
+    assert text.crop(20) is text
+
+
+def test_split_and_crop_lines():
+    text = Text.from_tags("[red]abc\ndefgh[/red]")
+
+    lines = list(Segment.split_and_crop_lines([Segment("> "), text], 4))
+    assert [_pieces(line) for line in lines] == [
+        [("> ", "None"), ("ab", "red")],
+        [("defg", "red")],
+    ]
+
+
+def test_render_lines():
+    text = Text("abc", style="red")
+    lines = Console().render_lines(text, 5, style=Style.parse("bold"))
+
+    assert _pieces(lines[0]) == [("abc", "bold red"), ("  ", "None")]
+
+
+def test_table():
+    table = Table(width=20)
+    table.add_column("Name")
+    table.add_row(Text.from_tags("[red]中文[/red]"))
+
+    assert table._columns[0]._cells_width == 4
+    assert "中文" in "".join(Console().render(table))
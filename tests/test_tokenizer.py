@@ -0,0 +1,76 @@
+import os, subprocess, sys
+
+import pytest
+
+from plenty._tokenizer import STYLE, TEXT, Token, tokenize
+from plenty.console import Console
+from plenty.emoji import Emoji
+from plenty.markup import render_markup
+from plenty.style import Style
+
+_PLENTY_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "no markup at all",
+        "Today is a b`nice` `day`<green,red>. :rainbow:",
+        "Today is a b`nice :rainbow:`<#FF0000> day.",
+        "Today is a `nice`<,sky_blue> day :abcde: :rainbow-text:",
+        "Today is a `nice`<> day.",
+        "Today is a b```nice``` day.",
+        "Today is a `nice`xxxxxxx day.",
+        "Today is a (bold,underline)`nice`<yellow> day.",
+        "Today is a bold,underline)`nice`<yellow> day.",
+        "Today is aXb`nice`<red> and ab(bold)`day`<red>.",
+        "i`Don't found Git, maybe need install.`tomato",
+        "12:30 :no_such_emoji:rainbow: `x`<red>",
+    ],
+)
+def test_same_as_two_pass(text: str):
+    wanted = Style.render_style(Emoji.render_emoji(text))
+    assert Console.render_str(text) == wanted
+
+
+def test_tokenize():
+    tokens = list(tokenize("a :rainbow: b`c`<red> d"))
+
+    assert tokens == [
+        Token(TEXT, "a 🌈 "),
+        Token(STYLE, "c", "b`c`<red>", "b", "red", None),
+        Token(TEXT, " d"),
+    ]
+    assert list(tokenize("a :rainbow: `c`<red>", emoji=False))[0] == Token(
+        TEXT, "a :rainbow: "
+    )
+
+
+def test_render_markup():
+    segments = render_markup("a :rainbow: b`c`<red> d")
+
+    assert [segment.text for segment in segments] == ["a 🌈 ", "c", " d"]
+    assert str(segments[1].style) == "bold red"
+
+
+@pytest.mark.parametrize(
+    "markup, emoji",
+    [("`a`<red>", False), ("`a:b:`<red>", False), ("`a`<red> :x", True)],
+)
+def test_emoji_table_not_loaded(markup: str, emoji: bool):
+    """Without emoji codes to render, the emoji table isn't loaded."""
+
+    code = (
+        "from plenty.emoji import Emoji; from plenty.markup import render_markup; "
+        f"list(render_markup({markup!r}, emoji={emoji!r})); "
+        "print('EMOTION' in vars(Emoji))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=_PLENTY_PATH,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"